@@ -10,6 +10,10 @@ class Settings(BaseSettings):
 
     # Database
     DATABASE_URL: str = "sqlite:///./cycling_trainer.db"
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE_SECONDS: int = 3600
+    DB_POOL_TIMEOUT_SECONDS: int = 30
 
     # Strava OAuth
     STRAVA_CLIENT_ID: str = ""
@@ -11,13 +11,26 @@ settings = get_settings()
 # Create SQLAlchemy engine
 # For SQLite, we need check_same_thread=False for FastAPI
 connect_args = {}
+pool_args = {}
 if settings.DATABASE_URL.startswith("sqlite"):
     connect_args = {"check_same_thread": False}
+else:
+    # Sync endpoints run in the threadpool, so size the pool for concurrent
+    # requests, bound how long a request waits for a connection and recycle
+    # connections before the server drops them
+    pool_args = {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT_SECONDS,
+        "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
+    }
 
 engine = create_engine(
     settings.DATABASE_URL,
     connect_args=connect_args,
+    pool_pre_ping=True,
     echo=False,
+    **pool_args,
 )
 
 # Create session factory
@@ -34,7 +47,7 @@ def get_db():
 
 
 def create_tables():
-    """Create all database tables."""
+    """Create all database tables and any indexes missing from existing ones."""
     # Import all models to ensure they are registered with Base
     from app.models import (  # noqa: F401
         User,
@@ -46,3 +59,10 @@ def create_tables():
         TrainingLoadRecord,
     )
     Base.metadata.create_all(bind=engine)
+
+    # create_all skips tables that already exist, so indexes added to a model
+    # later (e.g. ix_workout_plan_date_incomplete) would never reach deployed
+    # databases; create each one unless it is already there
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
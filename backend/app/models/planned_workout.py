@@ -4,7 +4,7 @@ from datetime import datetime
 from enum import Enum as PyEnum
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-from sqlalchemy import Integer, String, DateTime, Boolean, ForeignKey, Enum, Text
+from sqlalchemy import Integer, String, DateTime, Boolean, ForeignKey, Enum, Text, Index, text
 from sqlalchemy.types import JSON
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -30,6 +30,17 @@ class PlannedWorkout(Base):
     """Planned workout model for scheduled training sessions."""
 
     __tablename__ = "planned_workouts"
+    __table_args__ = (
+        Index("ix_workout_plan_date", "plan_id", "date"),
+        # Matches the upcoming-workouts filter (plan_id, date range, not completed)
+        Index(
+            "ix_workout_plan_date_incomplete",
+            "plan_id",
+            "date",
+            postgresql_where=text("completed = false"),
+            sqlite_where=text("completed = 0"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     plan_id: Mapped[int] = mapped_column(Integer, ForeignKey("training_plans.id"), index=True)
@@ -66,7 +77,8 @@ class PlannedWorkout(Base):
     )
 
     # Relationships
-    plan: Mapped["TrainingPlan"] = relationship("TrainingPlan", back_populates="workouts")
+    # Never lazy-load: workout queries filter through an explicit join on the plan
+    plan: Mapped["TrainingPlan"] = relationship("TrainingPlan", back_populates="workouts", lazy="raise")
     completed_activity: Mapped[Optional["Activity"]] = relationship(
         "Activity", foreign_keys=[completed_activity_id]
     )
@@ -4,7 +4,7 @@ from datetime import datetime
 from enum import Enum as PyEnum
 from typing import TYPE_CHECKING, List, Optional
 
-from sqlalchemy import Integer, String, DateTime, Boolean, Float, ForeignKey, Enum
+from sqlalchemy import Integer, String, DateTime, Boolean, Float, ForeignKey, Enum, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base
@@ -25,6 +25,9 @@ class TrainingPlan(Base):
     """Training plan model for structured training programs."""
 
     __tablename__ = "training_plans"
+    __table_args__ = (
+        Index("ix_plan_user_active", "user_id", "is_active"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), index=True)
@@ -51,8 +54,9 @@ class TrainingPlan(Base):
 
     # Relationships
     user: Mapped["User"] = relationship("User", back_populates="training_plans")
+    # Never lazy-load: queries that need workouts must opt in with selectinload
     workouts: Mapped[List["PlannedWorkout"]] = relationship(
-        "PlannedWorkout", back_populates="plan", cascade="all, delete-orphan"
+        "PlannedWorkout", back_populates="plan", cascade="all, delete-orphan", lazy="raise"
     )
 
     def __repr__(self) -> str:
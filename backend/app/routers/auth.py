@@ -382,7 +382,7 @@ async def refresh_token(
         )
 
     # Verify user still exists
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
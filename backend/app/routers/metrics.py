@@ -6,7 +6,7 @@ from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, insert, select
 
 from app.database import get_db
 from app.models.activity import Activity
@@ -17,6 +17,7 @@ from app.schemas.metrics import (
     FitnessSummaryResponse,
     MetricsCalculateResponse,
     PowerZone,
+    PowerZones,
     PowerZonesResponse,
 )
 from app.services.auth_service import get_current_user
@@ -34,25 +35,46 @@ CTL_TIME_CONSTANT = 42  # days (fitness)
 ATL_TIME_CONSTANT = 7   # days (fatigue)
 
 
+# Columns needed to build a FitnessMetricResponse without loading the entity
+METRIC_RESPONSE_COLUMNS = (
+    FitnessMetric.id,
+    FitnessMetric.user_id,
+    FitnessMetric.date,
+    FitnessMetric.daily_tss,
+    FitnessMetric.ctl,
+    FitnessMetric.atl,
+    FitnessMetric.tsb,
+)
+
+
 def calculate_ewma_factor(time_constant: int) -> float:
     """Calculate the exponential weighted moving average factor."""
     return 2.0 / (time_constant + 1)
 
 
 @router.get("", response_model=List[FitnessMetricResponse])
-async def list_metrics(
+def list_metrics(
     from_date: Optional[date] = Query(None, description="Start date for metrics"),
     to_date: Optional[date] = Query(None, description="End date for metrics"),
+    before: Optional[date] = Query(
+        None,
+        description="Keyset cursor: only return metrics dated before this (pass the last date of the previous page)"
+    ),
     limit: int = Query(90, ge=1, le=365, description="Maximum number of days to return"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
-) -> List[FitnessMetric]:
+) -> List[FitnessMetricResponse]:
     """
     List fitness metrics for the current user.
 
+    Selects only the response columns so rows are read as plain mappings
+    instead of hydrating full ORM entities. Pages are fetched by keyset on
+    date via the (user_id, date) unique index, so deep pages stay cheap.
+
     Args:
         from_date: Optional start date filter
         to_date: Optional end date filter
+        before: Optional keyset cursor (exclusive upper date bound)
         limit: Maximum number of records to return
         current_user: The authenticated user
         db: Database session
@@ -60,24 +82,25 @@ async def list_metrics(
     Returns:
         List of fitness metrics
     """
-    query = db.query(FitnessMetric).filter(FitnessMetric.user_id == current_user.id)
+    stmt = select(*METRIC_RESPONSE_COLUMNS).where(FitnessMetric.user_id == current_user.id)
 
     if from_date:
-        query = query.filter(FitnessMetric.date >= from_date)
+        stmt = stmt.where(FitnessMetric.date >= from_date)
     if to_date:
-        query = query.filter(FitnessMetric.date <= to_date)
+        stmt = stmt.where(FitnessMetric.date <= to_date)
+    if before:
+        stmt = stmt.where(FitnessMetric.date < before)
 
-    query = query.order_by(FitnessMetric.date.desc())
-    metrics = query.limit(limit).all()
+    stmt = stmt.order_by(FitnessMetric.date.desc()).limit(limit)
 
-    return metrics
+    return [FitnessMetricResponse(**row) for row in db.execute(stmt).mappings()]
 
 
 @router.get("/current", response_model=FitnessMetricResponse)
-async def get_current_metrics(
+def get_current_metrics(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
-) -> FitnessMetric:
+) -> FitnessMetricResponse:
     """
     Get the most recent fitness metrics for the current user.
 
@@ -91,21 +114,24 @@ async def get_current_metrics(
     Raises:
         HTTPException: 404 if no metrics found
     """
-    metric = db.query(FitnessMetric).filter(
-        FitnessMetric.user_id == current_user.id
-    ).order_by(FitnessMetric.date.desc()).first()
-
-    if not metric:
+    row = db.execute(
+        select(*METRIC_RESPONSE_COLUMNS)
+        .where(FitnessMetric.user_id == current_user.id)
+        .order_by(FitnessMetric.date.desc())
+        .limit(1)
+    ).mappings().first()
+
+    if row is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="No fitness metrics found. Please calculate metrics first.",
         )
 
-    return metric
+    return FitnessMetricResponse(**row)
 
 
 @router.get("/summary", response_model=FitnessSummaryResponse)
-async def get_fitness_summary(
+def get_fitness_summary(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ) -> FitnessSummaryResponse:
@@ -162,7 +188,7 @@ async def get_fitness_summary(
 
 
 @router.post("/calculate", response_model=MetricsCalculateResponse)
-async def calculate_metrics(
+def calculate_metrics(
     days: int = Query(90, ge=1, le=365, description="Number of days to calculate"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -194,16 +220,15 @@ async def calculate_metrics(
     activities = db.query(Activity).filter(
         Activity.user_id == current_user.id,
         Activity.date >= start_date,
+        Activity.date < today + timedelta(days=1),
         Activity.tss.isnot(None)
     ).order_by(Activity.date).all()
 
-    # Group activities by date and sum TSS
-    daily_tss = {}
+    # Sum TSS per day, indexed by day offset from start_date (NULL TSS is
+    # already excluded by the query)
+    daily_tss = [0.0] * (days + 1)
     for activity in activities:
-        activity_date = activity.date.date()
-        if activity_date not in daily_tss:
-            daily_tss[activity_date] = 0
-        daily_tss[activity_date] += activity.tss or 0
+        daily_tss[(activity.date.date() - start_date).days] += activity.tss
 
     # Get the most recent metric before start_date for continuity
     previous_metric = db.query(FitnessMetric).filter(
@@ -211,6 +236,52 @@ async def calculate_metrics(
         FitnessMetric.date < start_date
     ).order_by(FitnessMetric.date.desc()).first()
 
+    # Without activities or prior load every day is zero, so reset any
+    # existing rows in one statement and insert zero rows for the missing
+    # days with one executemany INSERT instead of upserting day by day
+    if not activities and previous_metric is None:
+        window = (
+            FitnessMetric.user_id == current_user.id,
+            FitnessMetric.date >= start_date,
+            FitnessMetric.date <= today,
+        )
+        metrics_updated = db.query(FitnessMetric).filter(*window).update(
+            {"daily_tss": 0.0, "ctl": 0.0, "atl": 0.0, "tsb": 0.0},
+            synchronize_session=False,
+        )
+
+        existing_dates = set(db.scalars(select(FitnessMetric.date).where(*window)))
+        missing_rows = [
+            {
+                "user_id": current_user.id,
+                "date": start_date + timedelta(days=offset),
+                "daily_tss": 0.0,
+                "ctl": 0.0,
+                "atl": 0.0,
+                "tsb": 0.0,
+            }
+            for offset in range(days + 1)
+            if start_date + timedelta(days=offset) not in existing_dates
+        ]
+        if missing_rows:
+            db.execute(insert(FitnessMetric), missing_rows)
+        metrics_created = len(missing_rows)
+        db.commit()
+
+        logger.info(
+            f"No training load for user {current_user.id}, "
+            f"created {metrics_created} and reset {metrics_updated} zero metrics"
+        )
+
+        return MetricsCalculateResponse(
+            days_calculated=days,
+            metrics_created=metrics_created,
+            metrics_updated=metrics_updated,
+            current_ctl=0.0,
+            current_atl=0.0,
+            current_tsb=0.0,
+        )
+
     # Initialize CTL and ATL
     ctl = previous_metric.ctl if previous_metric else 0.0
     atl = previous_metric.atl if previous_metric else 0.0
@@ -223,9 +294,8 @@ async def calculate_metrics(
     metrics_updated = 0
 
     # Calculate metrics for each day
-    current_date = start_date
-    while current_date <= today:
-        tss = daily_tss.get(current_date, 0)
+    for offset, tss in enumerate(daily_tss):
+        current_date = start_date + timedelta(days=offset)
 
         # Update CTL and ATL using EWMA
         ctl = ctl + ctl_factor * (tss - ctl)
@@ -256,8 +326,6 @@ async def calculate_metrics(
             db.add(metric)
             metrics_created += 1
 
-        current_date += timedelta(days=1)
-
     db.commit()
 
     logger.info(f"Metrics calculation complete: {metrics_created} created, {metrics_updated} updated")
@@ -273,7 +341,7 @@ async def calculate_metrics(
 
 
 @router.delete("/", status_code=status.HTTP_204_NO_CONTENT)
-async def clear_metrics(
+def clear_metrics(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ) -> None:
@@ -286,9 +354,10 @@ async def clear_metrics(
         current_user: The authenticated user
         db: Database session
     """
+    # Nothing in this session holds the deleted rows, so skip ORM sync
     db.query(FitnessMetric).filter(
         FitnessMetric.user_id == current_user.id
-    ).delete()
+    ).delete(synchronize_session=False)
     db.commit()
 
     logger.info(f"Cleared all fitness metrics for user {current_user.id}")
@@ -303,7 +372,6 @@ async def get_power_zones(
         description="Override FTP value (optional, uses user's stored FTP if not provided)"
     ),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
 ) -> PowerZonesResponse:
     """
     Get power training zones based on FTP.
@@ -319,7 +387,6 @@ async def get_power_zones(
     Args:
         ftp_override: Optional FTP value to use instead of user's stored FTP
         current_user: The authenticated user
-        db: Database session
 
     Returns:
         Power zones with watt ranges
@@ -340,22 +407,16 @@ async def get_power_zones(
     zones_data = metrics_service.get_power_zones(ftp)
 
     # Convert to response model
-    zones = {
-        zone_key: PowerZone(
-            name=zone_info["name"],
-            min_watts=zone_info["min_watts"],
-            max_watts=zone_info["max_watts"],
-            min_percent=zone_info["min_percent"],
-            max_percent=zone_info["max_percent"]
-        )
+    zones = PowerZones(**{
+        zone_key: PowerZone(**zone_info)
         for zone_key, zone_info in zones_data.items()
-    }
+    })
 
     return PowerZonesResponse(ftp=ftp, zones=zones)
 
 
 @router.post("/recalculate", response_model=MetricsCalculateResponse)
-async def recalculate_metrics(
+def recalculate_metrics(
     days: int = Query(90, ge=7, le=365, description="Number of days to recalculate"),
     force: bool = Query(False, description="Force recalculation of all metrics"),
     current_user: User = Depends(get_current_user),
@@ -386,26 +447,14 @@ async def recalculate_metrics(
     """
     logger.info(f"Recalculating metrics for user {current_user.id}, days={days}, force={force}")
 
-    # Count existing metrics before recalculation
-    existing_count = db.query(FitnessMetric).filter(
-        FitnessMetric.user_id == current_user.id
-    ).count()
-
     # Use the metrics service for calculation
-    metrics = metrics_service.calculate_fitness_history(
+    metrics, metrics_created = metrics_service.calculate_fitness_history(
         db=db,
         user_id=current_user.id,
         days=days,
         recalculate=force
     )
 
-    # Count after recalculation
-    new_count = db.query(FitnessMetric).filter(
-        FitnessMetric.user_id == current_user.id
-    ).count()
-
-    metrics_created = max(0, new_count - existing_count)
-
     # Get current values from the most recent metric
     latest = metrics[-1] if metrics else None
     current_ctl = latest.ctl if latest else 0.0
@@ -435,7 +484,6 @@ async def calculate_tss(
         description="Override FTP value"
     ),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
 ) -> dict:
     """
     Calculate TSS for a workout.
@@ -448,7 +496,6 @@ async def calculate_tss(
         normalized_power: Normalized Power in watts
         ftp_override: Optional FTP override
         current_user: The authenticated user
-        db: Database session
 
     Returns:
         Calculated TSS and related metrics
@@ -486,7 +533,6 @@ async def estimate_tss_from_hr(
     duration_seconds: int = Query(..., ge=60, description="Workout duration in seconds"),
     avg_hr: int = Query(..., ge=40, le=250, description="Average heart rate"),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
 ) -> dict:
     """
     Estimate TSS from heart rate data.
@@ -498,7 +544,6 @@ async def estimate_tss_from_hr(
         duration_seconds: Workout duration in seconds
         avg_hr: Average heart rate during workout
         current_user: The authenticated user
-        db: Database session
 
     Returns:
         Estimated TSS and calculation parameters
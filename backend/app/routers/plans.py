@@ -5,7 +5,9 @@ from datetime import date, datetime, timedelta
 from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
+from fastapi.responses import StreamingResponse
+from sqlalchemy import and_, case, func, insert, literal, select
+from sqlalchemy.orm import Session, load_only, selectinload
 
 from app.database import get_db
 from app.models.training_plan import TrainingPlan, TrainingPhilosophy
@@ -20,6 +22,8 @@ from app.schemas.plans import (
     PlannedWorkoutCreate,
     PlannedWorkoutResponse,
     PlannedWorkoutUpdate,
+    BulkWorkoutRequest,
+    BulkWorkoutResult,
     ComplianceStats,
 )
 from app.services.auth_service import get_current_user
@@ -32,13 +36,108 @@ logger = logging.getLogger(__name__)
 plan_generator = PlanGenerator()
 adaptation_service = AdaptationService()
 
+# Columns needed to build a PlannedWorkoutResponse without loading the entity
+WORKOUT_RESPONSE_COLUMNS = (
+    PlannedWorkout.date,
+    PlannedWorkout.name,
+    PlannedWorkout.workout_type,
+    PlannedWorkout.duration_minutes,
+    PlannedWorkout.description,
+    PlannedWorkout.intervals_json,
+    PlannedWorkout.target_tss,
+    PlannedWorkout.target_if,
+    PlannedWorkout.id,
+    PlannedWorkout.plan_id,
+    PlannedWorkout.completed,
+    PlannedWorkout.completed_activity_id,
+    PlannedWorkout.created_at,
+    PlannedWorkout.updated_at,
+)
+
+# Rows fetched per round trip when streaming workout lists
+WORKOUT_STREAM_BATCH_SIZE = 200
+
+# Map TrainingPhilosophy to PlanPhilosophy
+PHILOSOPHY_MAP = {
+    TrainingPhilosophy.POLARIZED: PlanPhilosophy.POLARIZED,
+    TrainingPhilosophy.SWEET_SPOT: PlanPhilosophy.SWEET_SPOT,
+    TrainingPhilosophy.TRADITIONAL: PlanPhilosophy.TRADITIONAL,
+}
+
 router = APIRouter()
 
 
+def _get_owned_workout(db: Session, user_id: int, plan_id: int, workout_id: int) -> PlannedWorkout:
+    """Fetch a workout from one of the user's plans in a single query, or raise 404."""
+    workout = db.query(PlannedWorkout).join(TrainingPlan).filter(
+        PlannedWorkout.id == workout_id,
+        PlannedWorkout.plan_id == plan_id,
+        TrainingPlan.user_id == user_id,
+    ).first()
+
+    if not workout:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Workout {workout_id} not found in plan {plan_id}",
+        )
+
+    return workout
+
+
+def get_owned_plan(
+    plan_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> TrainingPlan:
+    """Dependency resolving a plan owned by the current user, or raising 404."""
+    # Session.get checks the identity map before querying
+    plan = db.get(TrainingPlan, plan_id)
+
+    if not plan or plan.user_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Plan {plan_id} not found",
+        )
+
+    return plan
+
+
+def _load_workouts(start_date: Optional[date], end_date: Optional[date]):
+    """Loader option for plan.workouts, restricted to an optional date window."""
+    criteria = []
+    if start_date:
+        criteria.append(PlannedWorkout.date >= start_date)
+    if end_date:
+        criteria.append(PlannedWorkout.date <= end_date)
+
+    if criteria:
+        return selectinload(TrainingPlan.workouts.and_(*criteria))
+    return selectinload(TrainingPlan.workouts)
+
+
+def get_owned_plan_with_workouts(
+    plan_id: int,
+    start_date: Optional[date] = Query(None, description="Only include workouts on or after this date"),
+    end_date: Optional[date] = Query(None, description="Only include workouts on or before this date"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> TrainingPlan:
+    """Same as get_owned_plan, with the (optionally date-filtered) workouts loaded up front."""
+    plan = db.get(TrainingPlan, plan_id, options=[_load_workouts(start_date, end_date)])
+
+    if not plan or plan.user_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Plan {plan_id} not found",
+        )
+
+    return plan
+
+
 # ============== Plan CRUD Endpoints ==============
 
 @router.get("", response_model=List[TrainingPlanSummary])
-async def list_plans(
+def list_plans(
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
@@ -51,21 +150,44 @@ async def list_plans(
 
     Returns summary information including compliance statistics.
     """
-    query = db.query(TrainingPlan).filter(TrainingPlan.user_id == current_user.id)
+    # Per-plan workout counts, aggregated in SQL so workouts are never hydrated
+    workout_counts = db.query(
+        PlannedWorkout.plan_id.label("plan_id"),
+        func.count(PlannedWorkout.id).label("total"),
+        func.sum(case((PlannedWorkout.completed == True, 1), else_=0)).label("completed"),
+    ).join(TrainingPlan).filter(
+        TrainingPlan.user_id == current_user.id
+    ).group_by(PlannedWorkout.plan_id).subquery()
+
+    query = db.query(
+        TrainingPlan,
+        func.coalesce(workout_counts.c.total, 0),
+        func.coalesce(workout_counts.c.completed, 0),
+    ).options(
+        load_only(
+            TrainingPlan.id,
+            TrainingPlan.name,
+            TrainingPlan.philosophy,
+            TrainingPlan.start_date,
+            TrainingPlan.end_date,
+            TrainingPlan.weekly_hours,
+            TrainingPlan.goal_event,
+            TrainingPlan.is_active,
+        )
+    ).outerjoin(
+        workout_counts, workout_counts.c.plan_id == TrainingPlan.id
+    ).filter(TrainingPlan.user_id == current_user.id)
 
     if is_active is not None:
         query = query.filter(TrainingPlan.is_active == is_active)
     if philosophy:
         query = query.filter(TrainingPlan.philosophy == philosophy)
 
-    plans = query.order_by(TrainingPlan.start_date.desc()).offset(skip).limit(limit).all()
+    rows = query.order_by(TrainingPlan.start_date.desc()).offset(skip).limit(limit).all()
 
     # Build summary responses with compliance data
     summaries = []
-    for plan in plans:
-        total = len(plan.workouts)
-        completed = len([w for w in plan.workouts if w.completed])
-
+    for plan, total, completed in rows:
         summaries.append(TrainingPlanSummary(
             id=plan.id,
             name=plan.name,
@@ -84,14 +206,20 @@ async def list_plans(
 
 
 @router.get("/active", response_model=TrainingPlanWithWorkouts)
-async def get_active_plan(
+def get_active_plan(
+    start_date: Optional[date] = Query(None, description="Only include workouts on or after this date"),
+    end_date: Optional[date] = Query(None, description="Only include workouts on or before this date"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ) -> TrainingPlan:
     """
-    Get the current active training plan with all workouts.
+    Get the current active training plan with its workouts.
+
+    Pass start_date/end_date to only include workouts within that window.
     """
-    plan = db.query(TrainingPlan).filter(
+    plan = db.query(TrainingPlan).options(
+        _load_workouts(start_date, end_date)
+    ).filter(
         TrainingPlan.user_id == current_user.id,
         TrainingPlan.is_active == True
     ).first()
@@ -106,36 +234,24 @@ async def get_active_plan(
 
 
 @router.get("/{plan_id}", response_model=TrainingPlanWithWorkouts)
-async def get_plan(
-    plan_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+def get_plan(
+    plan: TrainingPlan = Depends(get_owned_plan_with_workouts),
 ) -> TrainingPlan:
     """
     Get detailed information about a specific training plan.
 
-    Includes all workouts associated with the plan.
+    Includes the workouts associated with the plan, optionally limited
+    to a start_date/end_date window.
     """
-    plan = db.query(TrainingPlan).filter(
-        TrainingPlan.id == plan_id,
-        TrainingPlan.user_id == current_user.id
-    ).first()
-
-    if not plan:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Plan {plan_id} not found",
-        )
-
     return plan
 
 
 @router.post("", response_model=TrainingPlanResponse, status_code=status.HTTP_201_CREATED)
-async def create_plan(
+def create_plan(
     plan_data: TrainingPlanCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
-) -> TrainingPlan:
+) -> TrainingPlanResponse:
     """
     Create a new training plan.
 
@@ -146,7 +262,7 @@ async def create_plan(
         db.query(TrainingPlan).filter(
             TrainingPlan.user_id == current_user.id,
             TrainingPlan.is_active == True
-        ).update({"is_active": False})
+        ).update({"is_active": False}, synchronize_session=False)
 
     plan = TrainingPlan(
         user_id=current_user.id,
@@ -160,58 +276,50 @@ async def create_plan(
     )
 
     db.add(plan)
+    db.flush()
+    response = TrainingPlanResponse.model_validate(plan)
     db.commit()
-    db.refresh(plan)
 
-    logger.info(f"Created training plan {plan.id} for user {current_user.id}")
+    logger.info(f"Created training plan {response.id} for user {response.user_id}")
 
-    return plan
+    return response
 
 
 @router.patch("/{plan_id}", response_model=TrainingPlanResponse)
-async def update_plan(
+def update_plan(
     plan_id: int,
     plan_data: TrainingPlanUpdate,
+    plan: TrainingPlan = Depends(get_owned_plan),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
-) -> TrainingPlan:
+) -> TrainingPlanResponse:
     """
     Update a training plan's metadata.
     """
-    plan = db.query(TrainingPlan).filter(
-        TrainingPlan.id == plan_id,
-        TrainingPlan.user_id == current_user.id
-    ).first()
-
-    if not plan:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Plan {plan_id} not found",
-        )
-
     # If setting this plan as active, deactivate others
     if plan_data.is_active and not plan.is_active:
         db.query(TrainingPlan).filter(
             TrainingPlan.user_id == current_user.id,
             TrainingPlan.id != plan_id,
             TrainingPlan.is_active == True
-        ).update({"is_active": False})
+        ).update({"is_active": False}, synchronize_session=False)
 
     # Update fields
     update_data = plan_data.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(plan, field, value)
 
+    db.flush()
+    response = TrainingPlanResponse.model_validate(plan)
     db.commit()
-    db.refresh(plan)
 
-    logger.info(f"Updated training plan {plan_id} for user {current_user.id}")
+    logger.info(f"Updated training plan {plan_id} for user {response.user_id}")
 
-    return plan
+    return response
 
 
 @router.delete("/{plan_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_plan(
+def delete_plan(
     plan_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -221,89 +329,81 @@ async def delete_plan(
 
     This action cannot be undone.
     """
-    plan = db.query(TrainingPlan).filter(
+    user_id = current_user.id
+    owned_plan_ids = select(TrainingPlan.id).where(
         TrainingPlan.id == plan_id,
-        TrainingPlan.user_id == current_user.id
-    ).first()
+        TrainingPlan.user_id == user_id,
+    )
 
-    if not plan:
+    # Delete workouts and plan with bulk DELETEs rather than loading the plan
+    # and cascading through every workout object
+    db.query(PlannedWorkout).filter(
+        PlannedWorkout.plan_id.in_(owned_plan_ids)
+    ).delete(synchronize_session=False)
+    deleted = db.query(TrainingPlan).filter(
+        TrainingPlan.id == plan_id,
+        TrainingPlan.user_id == user_id,
+    ).delete(synchronize_session=False)
+
+    if not deleted:
+        db.rollback()
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Plan {plan_id} not found",
         )
 
-    db.delete(plan)
     db.commit()
 
-    logger.info(f"Deleted training plan {plan_id} for user {current_user.id}")
+    logger.info(f"Deleted training plan {plan_id} for user {user_id}")
 
 
 @router.post("/{plan_id}/activate", response_model=TrainingPlanResponse)
-async def activate_plan(
+def activate_plan(
     plan_id: int,
+    plan: TrainingPlan = Depends(get_owned_plan),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
-) -> TrainingPlan:
+) -> TrainingPlanResponse:
     """
     Activate a training plan and deactivate all others.
     """
-    plan = db.query(TrainingPlan).filter(
-        TrainingPlan.id == plan_id,
-        TrainingPlan.user_id == current_user.id
-    ).first()
-
-    if not plan:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Plan {plan_id} not found",
-        )
-
     # Deactivate all other plans
     db.query(TrainingPlan).filter(
         TrainingPlan.user_id == current_user.id,
         TrainingPlan.id != plan_id
-    ).update({"is_active": False})
+    ).update({"is_active": False}, synchronize_session=False)
 
     plan.is_active = True
+    db.flush()
+    response = TrainingPlanResponse.model_validate(plan)
     db.commit()
-    db.refresh(plan)
 
-    logger.info(f"Activated training plan {plan_id} for user {current_user.id}")
+    logger.info(f"Activated training plan {plan_id} for user {response.user_id}")
 
-    return plan
+    return response
 
 
 # ============== Workout Endpoints ==============
 
 @router.get("/{plan_id}/workouts", response_model=List[PlannedWorkoutResponse])
-async def get_plan_workouts(
+def get_plan_workouts(
     plan_id: int,
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
     workout_type: Optional[WorkoutType] = None,
     completed: Optional[bool] = None,
+    plan: TrainingPlan = Depends(get_owned_plan),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-) -> List[PlannedWorkout]:
+) -> StreamingResponse:
     """
     Get all workouts for a specific training plan.
 
     Supports filtering by date range, workout type, and completion status.
+    The list is streamed in batches, so large plans are never fully
+    loaded into memory.
     """
-    # Verify plan ownership
-    plan = db.query(TrainingPlan).filter(
-        TrainingPlan.id == plan_id,
-        TrainingPlan.user_id == current_user.id
-    ).first()
-
-    if not plan:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Plan {plan_id} not found",
-        )
-
-    # Build query
-    query = db.query(PlannedWorkout).filter(PlannedWorkout.plan_id == plan_id)
+    # Build query over plain columns; rows are serialized straight to JSON
+    query = db.query(*WORKOUT_RESPONSE_COLUMNS).filter(PlannedWorkout.plan_id == plan_id)
 
     if start_date:
         query = query.filter(PlannedWorkout.date >= start_date)
@@ -314,33 +414,30 @@ async def get_plan_workouts(
     if completed is not None:
         query = query.filter(PlannedWorkout.completed == completed)
 
-    workouts = query.order_by(PlannedWorkout.date).all()
+    rows = query.order_by(PlannedWorkout.date).yield_per(WORKOUT_STREAM_BATCH_SIZE)
 
-    return workouts
+    def stream_workouts():
+        # Rows come from the database, so skip re-validating them
+        yield b"["
+        for index, row in enumerate(rows):
+            if index:
+                yield b","
+            yield PlannedWorkoutResponse.model_construct(**row._mapping).model_dump_json().encode()
+        yield b"]"
+
+    return StreamingResponse(stream_workouts(), media_type="application/json")
 
 
 @router.get("/{plan_id}/workouts/upcoming", response_model=List[PlannedWorkoutResponse])
-async def get_upcoming_workouts(
+def get_upcoming_workouts(
     plan_id: int,
     days: int = Query(7, ge=1, le=30),
+    plan: TrainingPlan = Depends(get_owned_plan),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
 ) -> List[PlannedWorkout]:
     """
     Get upcoming workouts for the next N days.
     """
-    # Verify plan ownership
-    plan = db.query(TrainingPlan).filter(
-        TrainingPlan.id == plan_id,
-        TrainingPlan.user_id == current_user.id
-    ).first()
-
-    if not plan:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Plan {plan_id} not found",
-        )
-
     today = date.today()
     end_date = today + timedelta(days=days)
 
@@ -355,27 +452,15 @@ async def get_upcoming_workouts(
 
 
 @router.post("/{plan_id}/workouts", response_model=PlannedWorkoutResponse, status_code=status.HTTP_201_CREATED)
-async def create_workout(
+def create_workout(
     plan_id: int,
     workout_data: PlannedWorkoutCreate,
+    plan: TrainingPlan = Depends(get_owned_plan),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-) -> PlannedWorkout:
+) -> PlannedWorkoutResponse:
     """
     Create a new workout in a training plan.
     """
-    # Verify plan ownership
-    plan = db.query(TrainingPlan).filter(
-        TrainingPlan.id == plan_id,
-        TrainingPlan.user_id == current_user.id
-    ).first()
-
-    if not plan:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Plan {plan_id} not found",
-        )
-
     workout = PlannedWorkout(
         plan_id=plan_id,
         date=workout_data.date,
@@ -389,63 +474,45 @@ async def create_workout(
     )
 
     db.add(workout)
+    db.flush()
+    response = PlannedWorkoutResponse.model_validate(workout)
     db.commit()
-    db.refresh(workout)
 
-    logger.info(f"Created workout {workout.id} in plan {plan_id}")
+    logger.info(f"Created workout {response.id} in plan {plan_id}")
 
-    return workout
+    return response
 
 
 @router.patch("/{plan_id}/workouts/{workout_id}", response_model=PlannedWorkoutResponse)
-async def update_workout(
+def update_workout(
     plan_id: int,
     workout_id: int,
     workout_data: PlannedWorkoutUpdate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
-) -> PlannedWorkout:
+) -> PlannedWorkoutResponse:
     """
     Update a specific workout within a plan.
     """
     # Verify plan ownership and workout existence
-    plan = db.query(TrainingPlan).filter(
-        TrainingPlan.id == plan_id,
-        TrainingPlan.user_id == current_user.id
-    ).first()
-
-    if not plan:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Plan {plan_id} not found",
-        )
-
-    workout = db.query(PlannedWorkout).filter(
-        PlannedWorkout.id == workout_id,
-        PlannedWorkout.plan_id == plan_id,
-    ).first()
-
-    if not workout:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Workout {workout_id} not found in plan {plan_id}",
-        )
+    workout = _get_owned_workout(db, current_user.id, plan_id, workout_id)
 
     # Update fields
     update_data = workout_data.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(workout, field, value)
 
+    db.flush()
+    response = PlannedWorkoutResponse.model_validate(workout)
     db.commit()
-    db.refresh(workout)
 
     logger.info(f"Updated workout {workout_id} in plan {plan_id}")
 
-    return workout
+    return response
 
 
 @router.delete("/{plan_id}/workouts/{workout_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_workout(
+def delete_workout(
     plan_id: int,
     workout_id: int,
     db: Session = Depends(get_db),
@@ -454,123 +521,157 @@ async def delete_workout(
     """
     Delete a workout from a training plan.
     """
-    # Verify plan ownership
-    plan = db.query(TrainingPlan).filter(
-        TrainingPlan.id == plan_id,
-        TrainingPlan.user_id == current_user.id
-    ).first()
-
-    if not plan:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Plan {plan_id} not found",
-        )
-
-    workout = db.query(PlannedWorkout).filter(
+    # Ownership check and delete in a single statement
+    deleted = db.query(PlannedWorkout).filter(
         PlannedWorkout.id == workout_id,
         PlannedWorkout.plan_id == plan_id,
-    ).first()
+        PlannedWorkout.plan_id.in_(
+            select(TrainingPlan.id).where(TrainingPlan.user_id == current_user.id)
+        ),
+    ).delete(synchronize_session=False)
 
-    if not workout:
+    if not deleted:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Workout {workout_id} not found in plan {plan_id}",
         )
 
-    db.delete(workout)
     db.commit()
 
     logger.info(f"Deleted workout {workout_id} from plan {plan_id}")
 
 
 @router.post("/{plan_id}/workouts/{workout_id}/complete", response_model=PlannedWorkoutResponse)
-async def complete_workout(
+def complete_workout(
     plan_id: int,
     workout_id: int,
     activity_id: Optional[int] = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
-) -> PlannedWorkout:
+) -> PlannedWorkoutResponse:
     """
     Mark a workout as completed, optionally linking to a Strava activity.
     """
-    # Verify plan ownership
-    plan = db.query(TrainingPlan).filter(
-        TrainingPlan.id == plan_id,
-        TrainingPlan.user_id == current_user.id
-    ).first()
-
-    if not plan:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Plan {plan_id} not found",
-        )
-
-    workout = db.query(PlannedWorkout).filter(
-        PlannedWorkout.id == workout_id,
-        PlannedWorkout.plan_id == plan_id,
-    ).first()
-
-    if not workout:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Workout {workout_id} not found in plan {plan_id}",
-        )
+    # Verify plan ownership and workout existence
+    workout = _get_owned_workout(db, current_user.id, plan_id, workout_id)
 
     workout.completed = True
     if activity_id:
         workout.completed_activity_id = activity_id
 
+    db.flush()
+    response = PlannedWorkoutResponse.model_validate(workout)
     db.commit()
-    db.refresh(workout)
 
     logger.info(f"Marked workout {workout_id} as completed")
 
-    return workout
+    return response
+
+
+@router.post("/{plan_id}/workouts/bulk-complete", response_model=BulkWorkoutResult)
+def bulk_complete_workouts(
+    plan_id: int,
+    request: BulkWorkoutRequest,
+    plan: TrainingPlan = Depends(get_owned_plan),
+    db: Session = Depends(get_db),
+) -> BulkWorkoutResult:
+    """
+    Mark several workouts in a plan as completed in one request.
+
+    IDs that don't belong to the plan are ignored.
+    """
+    updated = db.query(PlannedWorkout).filter(
+        PlannedWorkout.plan_id == plan_id,
+        PlannedWorkout.id.in_(request.workout_ids),
+    ).update({"completed": True}, synchronize_session=False)
+    db.commit()
+
+    logger.info(f"Marked {updated} workouts as completed in plan {plan_id}")
+
+    return BulkWorkoutResult(updated=updated)
+
+
+@router.post("/{plan_id}/workouts/bulk-skip", response_model=BulkWorkoutResult)
+def bulk_skip_workouts(
+    plan_id: int,
+    request: BulkWorkoutRequest,
+    plan: TrainingPlan = Depends(get_owned_plan),
+    db: Session = Depends(get_db),
+) -> BulkWorkoutResult:
+    """
+    Mark several workouts in a plan as skipped in one request.
+
+    Applies the same [SKIPPED] description marker as the single skip
+    endpoint. IDs that don't belong to the plan are ignored.
+    """
+    updated = db.query(PlannedWorkout).filter(
+        PlannedWorkout.plan_id == plan_id,
+        PlannedWorkout.id.in_(request.workout_ids),
+    ).update(
+        {
+            "description": case(
+                (
+                    func.coalesce(PlannedWorkout.description, "") == "",
+                    "[SKIPPED]",
+                ),
+                else_=literal("[SKIPPED] ") + PlannedWorkout.description,
+            )
+        },
+        synchronize_session=False,
+    )
+    db.commit()
+
+    logger.info(f"Marked {updated} workouts as skipped in plan {plan_id}")
+
+    return BulkWorkoutResult(updated=updated)
 
 
 # ============== Compliance Endpoints ==============
 
 @router.get("/{plan_id}/compliance", response_model=ComplianceStats)
-async def get_compliance_stats(
+def get_compliance_stats(
     plan_id: int,
+    plan: TrainingPlan = Depends(get_owned_plan),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
 ) -> ComplianceStats:
     """
     Get compliance statistics for a training plan.
 
     Returns completion rates and TSS compliance.
     """
-    # Verify plan ownership
-    plan = db.query(TrainingPlan).filter(
-        TrainingPlan.id == plan_id,
-        TrainingPlan.user_id == current_user.id
-    ).first()
-
-    if not plan:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Plan {plan_id} not found",
-        )
-
-    # Get all workouts that should be completed (scheduled before today)
-    today = date.today()
-    past_workouts = [w for w in plan.workouts if w.date.date() <= today]
-    total_past = len(past_workouts)
-    completed = len([w for w in past_workouts if w.completed])
+    # Workouts that should be completed are those scheduled up to and including today
+    past_cutoff = datetime.combine(date.today() + timedelta(days=1), datetime.min.time())
+    is_past = PlannedWorkout.date < past_cutoff
+    is_completed = PlannedWorkout.completed == True
+
+    # Aggregate counts and TSS in the database instead of hydrating every workout
+    stats = db.query(
+        func.count(PlannedWorkout.id).label("total"),
+        func.coalesce(func.sum(case((is_completed, 1), else_=0)), 0).label("completed"),
+        func.coalesce(func.sum(case((is_past, 1), else_=0)), 0).label("past_total"),
+        func.coalesce(
+            func.sum(case((and_(is_past, is_completed), 1), else_=0)), 0
+        ).label("past_completed"),
+        func.coalesce(
+            func.sum(case((is_past, func.coalesce(PlannedWorkout.target_tss, 0)), else_=0)), 0
+        ).label("planned_tss"),
+    ).filter(PlannedWorkout.plan_id == plan_id).one()
+
+    total_past = stats.past_total
+    completed = stats.past_completed
+    completion_rate = completed / total_past if total_past > 0 else 0.0
 
     # Calculate TSS compliance
-    planned_tss = sum(w.target_tss or 0 for w in past_workouts)
+    planned_tss = stats.planned_tss
     # Note: Actual TSS would come from linked activities - simplified here
-    actual_tss = planned_tss * (completed / total_past) if total_past > 0 else 0
+    actual_tss = planned_tss * completion_rate
 
     return ComplianceStats(
-        total_workouts=len(plan.workouts),
-        completed_workouts=len([w for w in plan.workouts if w.completed]),
+        total_workouts=stats.total,
+        completed_workouts=stats.completed,
         past_workouts=total_past,
         past_completed=completed,
-        completion_rate=completed / total_past if total_past > 0 else 0.0,
+        completion_rate=completion_rate,
         planned_tss=planned_tss,
         actual_tss=actual_tss,
         tss_compliance=actual_tss / planned_tss if planned_tss > 0 else 0.0,
@@ -580,11 +681,12 @@ async def get_compliance_stats(
 # ============== Plan Generation & Adaptation Endpoints ==============
 
 @router.post("/{plan_id}/generate-workouts", response_model=List[PlannedWorkoutResponse])
-async def generate_workouts(
+def generate_workouts(
     plan_id: int,
     training_days: List[int] = Query(..., description="Training days (0=Monday, 6=Sunday)"),
     ftp: int = Query(..., ge=50, le=500, description="Functional Threshold Power"),
     current_ctl: float = Query(0, ge=0, description="Current Chronic Training Load"),
+    plan: TrainingPlan = Depends(get_owned_plan),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ) -> List[PlannedWorkout]:
@@ -596,27 +698,12 @@ async def generate_workouts(
     - **sweet_spot**: Focus on 88-94% FTP
     - **traditional**: Base -> Build -> Peak -> Taper periodization
     """
-    plan = db.query(TrainingPlan).filter(
-        TrainingPlan.id == plan_id,
-        TrainingPlan.user_id == current_user.id
-    ).first()
-
-    if not plan:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Plan {plan_id} not found",
-        )
-
     # Delete existing workouts if any
-    db.query(PlannedWorkout).filter(PlannedWorkout.plan_id == plan_id).delete()
+    db.query(PlannedWorkout).filter(PlannedWorkout.plan_id == plan_id).delete(
+        synchronize_session=False
+    )
 
-    # Map TrainingPhilosophy to PlanPhilosophy
-    philosophy_map = {
-        TrainingPhilosophy.POLARIZED: PlanPhilosophy.POLARIZED,
-        TrainingPhilosophy.SWEET_SPOT: PlanPhilosophy.SWEET_SPOT,
-        TrainingPhilosophy.TRADITIONAL: PlanPhilosophy.TRADITIONAL,
-    }
-    plan_philosophy = philosophy_map.get(plan.philosophy, PlanPhilosophy.POLARIZED)
+    plan_philosophy = PHILOSOPHY_MAP.get(plan.philosophy, PlanPhilosophy.POLARIZED)
 
     # Generate workouts
     workouts = plan_generator.generate_plan(
@@ -631,15 +718,32 @@ async def generate_workouts(
         ftp=ftp,
     )
 
-    # Add workouts to database
-    for workout in workouts:
-        db.add(workout)
-
+    # Insert all workouts with one executemany INSERT instead of a flush and
+    # refresh per workout
+    db.execute(
+        insert(PlannedWorkout),
+        [
+            {
+                "plan_id": workout.plan_id,
+                "date": workout.date,
+                "name": workout.name,
+                "workout_type": workout.workout_type,
+                "duration_minutes": workout.duration_minutes,
+                "description": workout.description,
+                "intervals_json": workout.intervals_json,
+                "target_tss": workout.target_tss,
+                "target_if": workout.target_if,
+                "completed": workout.completed,
+            }
+            for workout in workouts
+        ],
+    )
     db.commit()
 
-    # Refresh to get IDs
-    for workout in workouts:
-        db.refresh(workout)
+    # Load the inserted rows back in generation order with a single SELECT
+    workouts = db.query(PlannedWorkout).filter(
+        PlannedWorkout.plan_id == plan_id
+    ).order_by(PlannedWorkout.id).all()
 
     logger.info(f"Generated {len(workouts)} workouts for plan {plan_id}")
 
@@ -647,10 +751,10 @@ async def generate_workouts(
 
 
 @router.post("/{plan_id}/adapt")
-async def trigger_adaptation(
+def trigger_adaptation(
     plan_id: int,
+    plan: TrainingPlan = Depends(get_owned_plan),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
 ) -> dict:
     """
     Trigger plan adaptation based on recent workout completions.
@@ -660,17 +764,6 @@ async def trigger_adaptation(
     - Reduces volume after missed workouts
     - Inserts recovery weeks after consecutive misses
     """
-    plan = db.query(TrainingPlan).filter(
-        TrainingPlan.id == plan_id,
-        TrainingPlan.user_id == current_user.id
-    ).first()
-
-    if not plan:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Plan {plan_id} not found",
-        )
-
     try:
         result = adaptation_service.adapt_plan(plan_id, db)
         logger.info(f"Triggered adaptation for plan {plan_id}: {result}")
@@ -683,7 +776,7 @@ async def trigger_adaptation(
 
 
 @router.post("/{plan_id}/workouts/{workout_id}/skip", response_model=PlannedWorkoutResponse)
-async def skip_workout(
+def skip_workout(
     plan_id: int,
     workout_id: int,
     db: Session = Depends(get_db),
@@ -694,27 +787,7 @@ async def skip_workout(
 
     This may trigger adaptation rules if multiple workouts are skipped.
     """
-    plan = db.query(TrainingPlan).filter(
-        TrainingPlan.id == plan_id,
-        TrainingPlan.user_id == current_user.id
-    ).first()
-
-    if not plan:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Plan {plan_id} not found",
-        )
-
-    workout = db.query(PlannedWorkout).filter(
-        PlannedWorkout.id == workout_id,
-        PlannedWorkout.plan_id == plan_id,
-    ).first()
-
-    if not workout:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Workout {workout_id} not found in plan {plan_id}",
-        )
+    _get_owned_workout(db, current_user.id, plan_id, workout_id)
 
     try:
         updated_workout = adaptation_service.mark_workout_skipped(workout_id, db)
@@ -1,14 +1,16 @@
 """Workouts API router for managing planned workouts and exports."""
 
-from datetime import date
+from datetime import date, datetime, time
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
 from fastapi.responses import Response
-from sqlalchemy.orm import Session
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session, load_only
 
 from app.database import get_db
 from app.models.planned_workout import PlannedWorkout
+from app.models.training_plan import TrainingPlan
 from app.models.user import User
 from app.schemas.workout import (
     ExportFormat,
@@ -16,6 +18,7 @@ from app.schemas.workout import (
     WorkoutCompleteRequest,
     WorkoutResponse,
     WorkoutSkipRequest,
+    WorkoutSummaryResponse,
 )
 from app.services.auth_service import get_current_user
 from app.services.export_service import export_service
@@ -31,8 +34,36 @@ EXPORT_CONTENT_TYPES = {
 }
 
 
-@router.get("/upcoming", response_model=List[WorkoutResponse])
-async def get_upcoming_workouts(
+def get_workout_by_id(
+    workout_id: int,
+    db: Session = Depends(get_db),
+) -> PlannedWorkout:
+    """
+    Dependency that loads a workout by ID.
+
+    Args:
+        workout_id: Unique identifier of the workout
+        db: Database session
+
+    Returns:
+        The workout
+
+    Raises:
+        HTTPException: 404 if workout not found
+    """
+    workout = db.get(PlannedWorkout, workout_id)
+
+    if not workout:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Workout with id {workout_id} not found",
+        )
+
+    return workout
+
+
+@router.get("/upcoming", response_model=List[WorkoutSummaryResponse])
+def get_upcoming_workouts(
     limit: int = Query(5, ge=1, le=20, description="Maximum number of workouts to return"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -48,15 +79,25 @@ async def get_upcoming_workouts(
         db: Database session
 
     Returns:
-        List of upcoming workouts ordered by scheduled date
+        List of upcoming workout summaries ordered by scheduled date
     """
-    from datetime import datetime
-    from app.models.training_plan import TrainingPlan
-
-    today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-
-    # Query workouts through the plan relationship to filter by user
-    workouts = db.query(PlannedWorkout).join(
+    # PlannedWorkout.date is a DateTime column, so compare against midnight
+    today = datetime.combine(date.today(), time.min)
+
+    # Query workouts through the plan relationship to filter by user, loading
+    # only the summary columns (skips decoding intervals_json)
+    workouts = db.query(PlannedWorkout).options(
+        load_only(
+            PlannedWorkout.id,
+            PlannedWorkout.plan_id,
+            PlannedWorkout.date,
+            PlannedWorkout.name,
+            PlannedWorkout.workout_type,
+            PlannedWorkout.duration_minutes,
+            PlannedWorkout.target_tss,
+            PlannedWorkout.completed,
+        )
+    ).join(
         TrainingPlan, PlannedWorkout.plan_id == TrainingPlan.id
     ).filter(
         TrainingPlan.user_id == current_user.id,
@@ -68,7 +109,7 @@ async def get_upcoming_workouts(
 
 
 @router.get("/calendar", response_model=List[WorkoutResponse])
-async def get_calendar_workouts(
+def get_calendar_workouts(
     start_date: date = Query(..., description="Start date for calendar range"),
     end_date: date = Query(..., description="End date for calendar range"),
     plan_id: Optional[int] = Query(None, description="Filter by specific plan ID"),
@@ -91,12 +132,9 @@ async def get_calendar_workouts(
     Returns:
         List of workouts within the date range
     """
-    from datetime import datetime
-    from app.models.training_plan import TrainingPlan
-
     # Convert dates to datetime for comparison
-    start_datetime = datetime.combine(start_date, datetime.min.time())
-    end_datetime = datetime.combine(end_date, datetime.max.time())
+    start_datetime = datetime.combine(start_date, time.min)
+    end_datetime = datetime.combine(end_date, time.max)
 
     # Build query
     query = db.query(PlannedWorkout).join(
@@ -118,16 +156,14 @@ async def get_calendar_workouts(
 
 
 @router.get("/{workout_id}", response_model=WorkoutResponse)
-async def get_workout(
-    workout_id: int,
-    db: Session = Depends(get_db),
+def get_workout(
+    workout: PlannedWorkout = Depends(get_workout_by_id),
 ) -> PlannedWorkout:
     """
     Get workout details by ID.
 
     Args:
-        workout_id: Unique identifier of the workout
-        db: Database session
+        workout: The workout, loaded by ID
 
     Returns:
         Workout details
@@ -135,23 +171,15 @@ async def get_workout(
     Raises:
         HTTPException: 404 if workout not found
     """
-    workout = db.query(PlannedWorkout).filter(PlannedWorkout.id == workout_id).first()
-
-    if not workout:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Workout with id {workout_id} not found",
-        )
-
     return workout
 
 
 @router.get("/{workout_id}/export")
-async def export_workout(
-    workout_id: int,
+def export_workout(
     format: ExportFormat = Query(..., description="Export format (zwo or mrc)"),
     ftp: int = Query(200, ge=100, le=500, description="Athlete's FTP for reference"),
-    db: Session = Depends(get_db),
+    if_none_match: Optional[str] = Header(None),
+    workout: PlannedWorkout = Depends(get_workout_by_id),
 ) -> Response:
     """
     Export workout to cycling platform format.
@@ -160,11 +188,14 @@ async def export_workout(
     - **zwo**: Zwift Workout file (XML)
     - **mrc**: Rouvy/ErgVideo format (tab-separated)
 
+    The response carries an ETag derived from the workout version, FTP and
+    format; sending it back in If-None-Match returns 304 without a body.
+
     Args:
-        workout_id: Unique identifier of the workout
         format: Export format (zwo or mrc)
         ftp: Athlete's FTP in watts (default: 200)
-        db: Database session
+        if_none_match: ETag(s) the client already holds
+        workout: The workout, loaded by ID
 
     Returns:
         File download response with appropriate content type
@@ -172,48 +203,40 @@ async def export_workout(
     Raises:
         HTTPException: 404 if workout not found
     """
-    workout = db.query(PlannedWorkout).filter(PlannedWorkout.id == workout_id).first()
+    # The export is fully determined by the workout version, FTP and format
+    etag = f'"{workout.id}-{workout.updated_at:%Y%m%d%H%M%S%f}-{ftp}-{format.value}"'
 
-    if not workout:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Workout with id {workout_id} not found",
-        )
+    if if_none_match:
+        client_etags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if etag in client_etags or "*" in client_etags:
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED,
+                headers={"ETag": etag},
+            )
 
-    # Generate export content based on format
-    if format == ExportFormat.ZWO:
-        content = export_service.export_to_zwo(workout, ftp)
-    elif format == ExportFormat.MRC:
-        content = export_service.export_to_mrc(workout, ftp)
-    elif format == ExportFormat.ERG:
-        content = export_service.export_to_erg(workout, ftp)
-    else:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Unsupported export format: {format}",
-        )
+    # Generate export content; the format query is enum-validated by FastAPI
+    content = export_service.render(workout, format.value, ftp)
 
     # Generate filename
     filename = export_service.generate_filename(workout, format.value)
     content_type = EXPORT_CONTENT_TYPES[format]
 
-    # Return file response
+    # Return file response; Response derives Content-Length from the body
     return Response(
         content=content,
         media_type=content_type,
         headers={
             "Content-Disposition": f'attachment; filename="{filename}"',
-            "Content-Length": str(len(content.encode("utf-8"))),
+            "ETag": etag,
         },
     )
 
 
 @router.get("/{workout_id}/export/metadata", response_model=ExportResponse)
-async def get_export_metadata(
-    workout_id: int,
+def get_export_metadata(
     format: ExportFormat = Query(..., description="Export format (zwo or mrc)"),
     ftp: int = Query(200, ge=100, le=500, description="Athlete's FTP for reference"),
-    db: Session = Depends(get_db),
+    workout: PlannedWorkout = Depends(get_workout_by_id),
 ) -> ExportResponse:
     """
     Get export metadata without downloading the file.
@@ -221,46 +244,30 @@ async def get_export_metadata(
     Useful for showing file info before download.
 
     Args:
-        workout_id: Unique identifier of the workout
         format: Export format (zwo or mrc)
         ftp: Athlete's FTP in watts
-        db: Database session
+        workout: The workout, loaded by ID
 
     Returns:
         Export metadata including filename, format, and size
     """
-    workout = db.query(PlannedWorkout).filter(PlannedWorkout.id == workout_id).first()
-
-    if not workout:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Workout with id {workout_id} not found",
-        )
-
-    # Generate content to calculate size
-    if format == ExportFormat.ZWO:
-        content = export_service.export_to_zwo(workout, ftp)
-    elif format == ExportFormat.MRC:
-        content = export_service.export_to_mrc(workout, ftp)
-    elif format == ExportFormat.ERG:
-        content = export_service.export_to_erg(workout, ftp)
-    else:
-        content = export_service.export_to_mrc(workout, ftp)
+    # Size comes from the same cached render the download endpoint serves
+    content = export_service.render(workout, format.value, ftp)
 
     return ExportResponse(
         filename=export_service.generate_filename(workout, format.value),
         format=format,
         content_type=EXPORT_CONTENT_TYPES[format],
-        size_bytes=len(content.encode("utf-8")),
+        size_bytes=len(content),
     )
 
 
 @router.post("/{workout_id}/complete", response_model=WorkoutResponse)
-async def complete_workout(
+def complete_workout(
     workout_id: int,
     request: Optional[WorkoutCompleteRequest] = None,
     db: Session = Depends(get_db),
-) -> PlannedWorkout:
+) -> WorkoutResponse:
     """
     Mark a workout as complete.
 
@@ -276,39 +283,46 @@ async def complete_workout(
         HTTPException: 404 if workout not found
         HTTPException: 400 if workout already completed
     """
-    workout = db.query(PlannedWorkout).filter(PlannedWorkout.id == workout_id).first()
+    # Flip the flag only if the workout is still open; the WHERE clause is the
+    # "already completed" guard, so the common path is a single round-trip
+    values = {"completed": True}
 
-    if not workout:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Workout with id {workout_id} not found",
-        )
+    # Link to activity if provided
+    if request and request.completed_activity_id:
+        values["completed_activity_id"] = request.completed_activity_id
 
-    if workout.completed:
+    workout = db.scalars(
+        update(PlannedWorkout)
+        .where(PlannedWorkout.id == workout_id, PlannedWorkout.completed == False)
+        .values(**values)
+        .returning(PlannedWorkout)
+    ).one_or_none()
+
+    if not workout:
+        # Only a miss needs a read, to tell a missing workout from a completed one
+        exists = db.scalar(select(PlannedWorkout.id).where(PlannedWorkout.id == workout_id))
+        if exists is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Workout with id {workout_id} not found",
+            )
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Workout is already completed",
         )
 
-    # Update workout completion status
-    workout.completed = True
-
-    # Link to activity if provided
-    if request and request.completed_activity_id:
-        workout.completed_activity_id = request.completed_activity_id
-
+    response = WorkoutResponse.model_validate(workout)
     db.commit()
-    db.refresh(workout)
 
-    return workout
+    return response
 
 
 @router.post("/{workout_id}/skip", response_model=WorkoutResponse)
-async def skip_workout(
+def skip_workout(
     workout_id: int,
     request: Optional[WorkoutSkipRequest] = None,
     db: Session = Depends(get_db),
-) -> PlannedWorkout:
+) -> WorkoutResponse:
     """
     Mark a workout as skipped (uncomplete it).
 
@@ -323,7 +337,13 @@ async def skip_workout(
     Raises:
         HTTPException: 404 if workout not found
     """
-    workout = db.query(PlannedWorkout).filter(PlannedWorkout.id == workout_id).first()
+    # Mark workout as not completed and unlink activity
+    workout = db.scalars(
+        update(PlannedWorkout)
+        .where(PlannedWorkout.id == workout_id)
+        .values(completed=False, completed_activity_id=None)
+        .returning(PlannedWorkout)
+    ).one_or_none()
 
     if not workout:
         raise HTTPException(
@@ -331,11 +351,7 @@ async def skip_workout(
             detail=f"Workout with id {workout_id} not found",
         )
 
-    # Mark workout as not completed and unlink activity
-    workout.completed = False
-    workout.completed_activity_id = None
-
+    response = WorkoutResponse.model_validate(workout)
     db.commit()
-    db.refresh(workout)
 
-    return workout
+    return response
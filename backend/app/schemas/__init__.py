@@ -8,12 +8,14 @@ from app.schemas.workout import (
     WorkoutIntervalSchema,
     WorkoutResponse,
     WorkoutSkipRequest,
+    WorkoutSummaryResponse,
 )
 from app.schemas.metrics import (
     FitnessMetricResponse,
     FitnessHistoryResponse,
     FitnessSummary,
     PowerZone,
+    PowerZones,
     PowerZonesResponse,
     RecalculateRequest,
     RecalculateResponse,
@@ -36,6 +38,8 @@ from app.schemas.plans import (
     PlannedWorkoutCreate,
     PlannedWorkoutUpdate,
     PlannedWorkoutResponse,
+    BulkWorkoutRequest,
+    BulkWorkoutResult,
     ComplianceStats,
 )
 
@@ -48,11 +52,13 @@ __all__ = [
     "WorkoutIntervalSchema",
     "WorkoutResponse",
     "WorkoutSkipRequest",
+    "WorkoutSummaryResponse",
     # Metrics schemas
     "FitnessMetricResponse",
     "FitnessHistoryResponse",
     "FitnessSummary",
     "PowerZone",
+    "PowerZones",
     "PowerZonesResponse",
     "RecalculateRequest",
     "RecalculateResponse",
@@ -73,5 +79,7 @@ __all__ = [
     "PlannedWorkoutCreate",
     "PlannedWorkoutUpdate",
     "PlannedWorkoutResponse",
+    "BulkWorkoutRequest",
+    "BulkWorkoutResult",
     "ComplianceStats",
 ]
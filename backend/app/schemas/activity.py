@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ActivityBase(BaseModel):
@@ -39,9 +39,9 @@ class ActivityResponse(ActivityBase):
     calories: Optional[float] = Field(None, description="Calories burned")
     created_at: datetime = Field(..., description="Created timestamp")
 
-    class Config:
-        from_attributes = True
-        json_schema_extra = {
+    model_config = ConfigDict(
+        from_attributes=True,
+        json_schema_extra={
             "example": {
                 "id": 1,
                 "user_id": 42,
@@ -62,7 +62,8 @@ class ActivityResponse(ActivityBase):
                 "calories": 850,
                 "created_at": "2024-01-15T10:00:00Z"
             }
-        }
+        },
+    )
 
 
 class ActivitySyncResponse(BaseModel):
@@ -72,11 +73,12 @@ class ActivitySyncResponse(BaseModel):
     updated_activities: int = Field(..., ge=0, description="Number of activities updated")
     total_synced: int = Field(..., ge=0, description="Total activities processed")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "new_activities": 5,
                 "updated_activities": 2,
                 "total_synced": 7
             }
-        }
+        },
+    )
@@ -3,7 +3,7 @@
 from datetime import date as date_type
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 # --- Fitness Signature Schemas ---
@@ -23,8 +23,9 @@ class FitnessSignatureResponse(FitnessSignatureBase):
     date: date_type = Field(..., description="Date of signature")
     source: str = Field(..., description="Source of measurement")
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(
+        from_attributes=True,
+    )
 
 
 # --- 3D Training Load Schemas ---
@@ -74,8 +75,9 @@ class TrainingLoadRecordResponse(BaseModel):
     # Status
     status: str = Field(..., description="Training status")
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(
+        from_attributes=True,
+    )
 
 
 # --- Athlete Context Schemas ---
@@ -135,8 +137,8 @@ class ForecastConfigCreate(BaseModel):
         description="Training availability by day"
     )
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "program_type": "event",
                 "target_date": "2025-06-01",
@@ -155,7 +157,8 @@ class ForecastConfigCreate(BaseModel):
                     "Sunday": {"available": True, "duration": 90}
                 }
             }
-        }
+        },
+    )
 
 
 class AthleteContextResponse(BaseModel):
@@ -175,8 +178,8 @@ class AthleteContextResponse(BaseModel):
     # Metrics
     weekly_xss_average: float = Field(..., ge=0, description="Average weekly XSS")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "user_id": 1,
                 "ftp": 250,
@@ -192,7 +195,8 @@ class AthleteContextResponse(BaseModel):
                 "status": "tired",
                 "weekly_xss_average": 420.5
             }
-        }
+        },
+    )
 
 
 # --- Plan Generation Response Schemas ---
@@ -243,8 +247,8 @@ class GeneratedPlanResponse(BaseModel):
         description="Predicted fitness at target date"
     )
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "plan_id": 1,
                 "workouts": [
@@ -284,7 +288,8 @@ class GeneratedPlanResponse(BaseModel):
                     "form": {"low": 8.5, "high": 5.2, "peak": 3.1}
                 }
             }
-        }
+        },
+    )
 
 
 # --- Training Load History Schemas ---
@@ -4,8 +4,8 @@ Authentication and user-related Pydantic schemas.
 These schemas define the request/response models for authentication endpoints.
 """
 
-from typing import Optional
-from pydantic import BaseModel, EmailStr, Field
+from typing import Literal, Optional
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class UserResponse(BaseModel):
@@ -54,9 +54,9 @@ class UserResponse(BaseModel):
     has_power_meter: Optional[bool] = Field(None, description="Has power meter")
     has_indoor_trainer: Optional[bool] = Field(None, description="Has indoor trainer")
 
-    class Config:
-        from_attributes = True
-        json_schema_extra = {
+    model_config = ConfigDict(
+        from_attributes=True,
+        json_schema_extra={
             "example": {
                 "id": 1,
                 "strava_id": 12345678,
@@ -74,7 +74,8 @@ class UserResponse(BaseModel):
                 "has_power_meter": True,
                 "has_indoor_trainer": True
             }
-        }
+        },
+    )
 
 
 class TokenResponse(BaseModel):
@@ -91,13 +92,14 @@ class TokenResponse(BaseModel):
     access_token: str = Field(..., description="JWT access token")
     token_type: str = Field(default="bearer", description="Token type")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "access_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
                 "token_type": "bearer"
             }
-        }
+        },
+    )
 
 
 class AuthResponse(BaseModel):
@@ -114,23 +116,15 @@ class AuthResponse(BaseModel):
     user: UserResponse = Field(..., description="User profile data")
     token: TokenResponse = Field(..., description="Authentication token")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
+            # Reuse the nested schemas' examples rather than restating them
             "example": {
-                "user": {
-                    "id": 1,
-                    "strava_id": 12345678,
-                    "name": "Jane Cyclist",
-                    "email": "jane@example.com",
-                    "ftp": 250,
-                    "profile_image": "https://example.com/avatar.jpg"
-                },
-                "token": {
-                    "access_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
-                    "token_type": "bearer"
-                }
+                "user": UserResponse.model_config["json_schema_extra"]["example"],
+                "token": TokenResponse.model_config["json_schema_extra"]["example"],
             }
-        }
+        },
+    )
 
 
 class StravaCallbackRequest(BaseModel):
@@ -145,12 +139,13 @@ class StravaCallbackRequest(BaseModel):
 
     code: str = Field(..., description="Authorization code from Strava OAuth")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "code": "abc123def456"
             }
-        }
+        },
+    )
 
 
 class UserUpdate(BaseModel):
@@ -184,16 +179,16 @@ class UserUpdate(BaseModel):
     resting_hr: Optional[int] = Field(None, ge=30, le=100, description="Resting HR in bpm (30-100)")
 
     # Training profile
-    experience_level: Optional[str] = Field(None, pattern="^(beginner|intermediate|advanced|elite)$", description="Experience level")
-    primary_discipline: Optional[str] = Field(None, pattern="^(road|mtb|gravel|track|indoor)$", description="Primary discipline")
+    experience_level: Optional[Literal["beginner", "intermediate", "advanced", "elite"]] = Field(None, description="Experience level")
+    primary_discipline: Optional[Literal["road", "mtb", "gravel", "track", "indoor"]] = Field(None, description="Primary discipline")
     default_weekly_hours: Optional[int] = Field(None, ge=3, le=30, description="Weekly training hours (3-30)")
 
     # Equipment
     has_power_meter: Optional[bool] = Field(None, description="Has power meter")
     has_indoor_trainer: Optional[bool] = Field(None, description="Has indoor trainer")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "ftp": 260,
                 "name": "Jane Cyclist",
@@ -207,7 +202,8 @@ class UserUpdate(BaseModel):
                 "has_power_meter": True,
                 "has_indoor_trainer": True
             }
-        }
+        },
+    )
 
 
 class StravaLoginResponse(BaseModel):
@@ -222,9 +218,11 @@ class StravaLoginResponse(BaseModel):
 
     authorization_url: str = Field(..., description="Strava OAuth authorization URL")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        defer_build=True,
+        json_schema_extra={
             "example": {
                 "authorization_url": "https://www.strava.com/oauth/authorize?client_id=123&redirect_uri=..."
             }
-        }
+        },
+    )
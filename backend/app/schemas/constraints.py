@@ -0,0 +1,20 @@
+"""Shared constrained field types for API schemas."""
+
+from typing import Annotated
+
+from pydantic import Field
+
+# Power target as a decimal of FTP (0.50 = 50%)
+PowerFraction = Annotated[float, Field(ge=0.0, le=2.0)]
+
+# Target weekly training hours for a plan
+WeeklyHours = Annotated[float, Field(ge=1, le=40)]
+
+# Target intensity factor stored as an integer percentage
+TargetIFPercent = Annotated[int, Field(ge=0, le=150)]
+
+# Planned workout duration in minutes (10-600), used by the plans API
+PlannedWorkoutMinutes = Annotated[int, Field(ge=10, le=600)]
+
+# Scheduled workout duration in minutes (15-600), used by the plan/workout schemas
+ScheduledWorkoutMinutes = Annotated[int, Field(ge=15, le=600)]
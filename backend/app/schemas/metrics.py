@@ -3,7 +3,7 @@
 from datetime import date as date_type
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class FitnessMetricBase(BaseModel):
@@ -22,9 +22,9 @@ class FitnessMetricResponse(FitnessMetricBase):
     id: int = Field(..., description="Unique metric ID")
     user_id: int = Field(..., description="User ID")
 
-    class Config:
-        from_attributes = True
-        json_schema_extra = {
+    model_config = ConfigDict(
+        from_attributes=True,
+        json_schema_extra={
             "example": {
                 "id": 1,
                 "user_id": 42,
@@ -34,7 +34,32 @@ class FitnessMetricResponse(FitnessMetricBase):
                 "atl": 68.4,
                 "tsb": -13.2
             }
-        }
+        },
+    )
+
+
+class FitnessSummary(BaseModel):
+    """Summary statistics for a fitness period."""
+
+    current_ctl: float = Field(..., description="Current CTL (most recent)")
+    current_atl: float = Field(..., description="Current ATL (most recent)")
+    current_tsb: float = Field(..., description="Current TSB (most recent)")
+    avg_daily_tss: float = Field(..., ge=0, description="Average daily TSS")
+    total_tss: float = Field(..., ge=0, description="Total TSS for the period")
+    training_days: int = Field(..., ge=0, description="Number of days with training")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "current_ctl": 55.2,
+                "current_atl": 68.4,
+                "current_tsb": -13.2,
+                "avg_daily_tss": 37.8,
+                "total_tss": 2650.0,
+                "training_days": 45
+            }
+        },
+    )
 
 
 class FitnessHistoryResponse(BaseModel):
@@ -44,13 +69,13 @@ class FitnessHistoryResponse(BaseModel):
         ...,
         description="List of daily fitness metrics"
     )
-    summary: "FitnessSummary" = Field(
+    summary: FitnessSummary = Field(
         ...,
         description="Summary statistics for the period"
     )
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "metrics": [
                     {
@@ -81,30 +106,8 @@ class FitnessHistoryResponse(BaseModel):
                     "training_days": 45
                 }
             }
-        }
-
-
-class FitnessSummary(BaseModel):
-    """Summary statistics for a fitness period."""
-
-    current_ctl: float = Field(..., description="Current CTL (most recent)")
-    current_atl: float = Field(..., description="Current ATL (most recent)")
-    current_tsb: float = Field(..., description="Current TSB (most recent)")
-    avg_daily_tss: float = Field(..., ge=0, description="Average daily TSS")
-    total_tss: float = Field(..., ge=0, description="Total TSS for the period")
-    training_days: int = Field(..., ge=0, description="Number of days with training")
-
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "current_ctl": 55.2,
-                "current_atl": 68.4,
-                "current_tsb": -13.2,
-                "avg_daily_tss": 37.8,
-                "total_tss": 2650.0,
-                "training_days": 45
-            }
-        }
+        },
+    )
 
 
 class PowerZone(BaseModel):
@@ -125,14 +128,25 @@ class PowerZone(BaseModel):
     )
 
 
+class PowerZones(BaseModel):
+    """Schema for the fixed set of six power zones."""
+
+    zone_1: PowerZone = Field(..., description="Recovery")
+    zone_2: PowerZone = Field(..., description="Endurance")
+    zone_3: PowerZone = Field(..., description="Tempo")
+    zone_4: PowerZone = Field(..., description="Threshold")
+    zone_5: PowerZone = Field(..., description="VO2max")
+    zone_6: PowerZone = Field(..., description="Anaerobic")
+
+
 class PowerZonesResponse(BaseModel):
     """Schema for power zones response."""
 
     ftp: int = Field(..., ge=0, description="User's FTP used to calculate zones")
-    zones: dict[str, PowerZone] = Field(..., description="Power zones")
+    zones: PowerZones = Field(..., description="Power zones")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "ftp": 250,
                 "zones": {
@@ -180,7 +194,8 @@ class PowerZonesResponse(BaseModel):
                     }
                 }
             }
-        }
+        },
+    )
 
 
 class RecalculateRequest(BaseModel):
@@ -197,6 +212,8 @@ class RecalculateRequest(BaseModel):
         description="Force recalculation even for existing metrics"
     )
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class RecalculateResponse(BaseModel):
     """Schema for recalculate metrics response."""
@@ -223,8 +240,8 @@ class CurrentFitnessResponse(BaseModel):
         description="Training recommendation based on current form"
     )
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "date": "2024-01-15",
                 "ctl": 55.2,
@@ -233,7 +250,8 @@ class CurrentFitnessResponse(BaseModel):
                 "form_status": "Fatigued",
                 "recommendation": "Consider a recovery day or light workout to manage fatigue."
             }
-        }
+        },
+    )
 
 
 class FitnessSummaryResponse(BaseModel):
@@ -248,8 +266,8 @@ class FitnessSummaryResponse(BaseModel):
     month_tss: float = Field(..., ge=0, description="Total TSS for last 30 days")
     last_updated: Optional[date_type] = Field(None, description="Date of most recent metric")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "current_ctl": 55.2,
                 "current_atl": 68.4,
@@ -260,7 +278,8 @@ class FitnessSummaryResponse(BaseModel):
                 "month_tss": 1850.0,
                 "last_updated": "2024-01-15"
             }
-        }
+        },
+    )
 
 
 class MetricsCalculateResponse(BaseModel):
@@ -273,8 +292,9 @@ class MetricsCalculateResponse(BaseModel):
     current_atl: float = Field(..., description="Current ATL after calculation")
     current_tsb: float = Field(..., description="Current TSB after calculation")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        defer_build=True,
+        json_schema_extra={
             "example": {
                 "days_calculated": 90,
                 "metrics_created": 45,
@@ -283,4 +303,5 @@ class MetricsCalculateResponse(BaseModel):
                 "current_atl": 68.4,
                 "current_tsb": -13.2
             }
-        }
+        },
+    )
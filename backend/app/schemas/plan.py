@@ -1,8 +1,9 @@
 from datetime import date, datetime
-from typing import Optional, List
-from pydantic import BaseModel, Field, field_validator
+from typing import Annotated, Optional, List
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 from app.models.planned_workout import WorkoutType, WorkoutStatus
+from app.schemas.constraints import PowerFraction, ScheduledWorkoutMinutes, WeeklyHours
 from app.services.plan_generator import PlanPhilosophy
 
 
@@ -11,16 +12,16 @@ from app.services.plan_generator import PlanPhilosophy
 class WarmupCooldown(BaseModel):
     """Schema for warmup/cooldown structure"""
     duration: int = Field(..., description="Duration in seconds")
-    power_low: float = Field(..., ge=0, le=2, description="Low power as % of FTP")
-    power_high: float = Field(..., ge=0, le=2, description="High power as % of FTP")
+    power_low: PowerFraction = Field(..., description="Low power as % of FTP")
+    power_high: PowerFraction = Field(..., description="High power as % of FTP")
 
 
 class IntervalSet(BaseModel):
     """Schema for interval set structure"""
     duration: int = Field(..., description="Interval duration in seconds")
-    power: float = Field(..., ge=0, le=2, description="Target power as % of FTP")
+    power: PowerFraction = Field(..., description="Target power as % of FTP")
     rest_duration: int = Field(..., description="Rest duration in seconds")
-    rest_power: float = Field(..., ge=0, le=2, description="Rest power as % of FTP")
+    rest_power: PowerFraction = Field(..., description="Rest power as % of FTP")
     repeats: int = Field(..., ge=1, description="Number of repeats")
 
 
@@ -39,9 +40,9 @@ class WorkoutBase(BaseModel):
     workout_type: WorkoutType
     title: str = Field(..., max_length=255)
     description: Optional[str] = Field(None, max_length=1000)
-    duration_minutes: int = Field(..., ge=15, le=600)
+    duration_minutes: ScheduledWorkoutMinutes
     target_tss: Optional[float] = Field(None, ge=0)
-    target_if: Optional[float] = Field(None, ge=0, le=2)
+    target_if: Optional[PowerFraction] = None
 
 
 class WorkoutCreate(WorkoutBase):
@@ -55,9 +56,9 @@ class WorkoutUpdate(BaseModel):
     workout_type: Optional[WorkoutType] = None
     title: Optional[str] = Field(None, max_length=255)
     description: Optional[str] = Field(None, max_length=1000)
-    duration_minutes: Optional[int] = Field(None, ge=15, le=600)
+    duration_minutes: Optional[ScheduledWorkoutMinutes] = None
     target_tss: Optional[float] = Field(None, ge=0)
-    target_if: Optional[float] = Field(None, ge=0, le=2)
+    target_if: Optional[PowerFraction] = None
     interval_structure: Optional[IntervalStructure] = None
 
 
@@ -74,8 +75,9 @@ class WorkoutResponse(WorkoutBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(
+        from_attributes=True,
+    )
 
 
 class WorkoutLinkActivity(BaseModel):
@@ -84,6 +86,8 @@ class WorkoutLinkActivity(BaseModel):
     actual_tss: Optional[float] = None
     actual_duration_minutes: Optional[int] = None
 
+    model_config = ConfigDict(defer_build=True)
+
 
 # ============== Plan Schemas ==============
 
@@ -94,26 +98,22 @@ class PlanBase(BaseModel):
     philosophy: PlanPhilosophy
     start_date: date
     end_date: date
-    weekly_hours: float = Field(..., ge=1, le=40)
-    training_days: List[int] = Field(..., min_length=1, max_length=7)
+    weekly_hours: WeeklyHours
+    # Range checks run in pydantic-core; uniqueness is checked once per model below
+    training_days: List[Annotated[int, Field(ge=0, le=6)]] = Field(
+        ..., min_length=1, max_length=7,
+        description="Training weekdays, 0 (Monday) to 6 (Sunday)"
+    )
     target_event: Optional[str] = Field(None, max_length=255)
 
-    @field_validator('training_days')
-    @classmethod
-    def validate_training_days(cls, v):
-        if not all(0 <= day <= 6 for day in v):
-            raise ValueError('Training days must be between 0 (Monday) and 6 (Sunday)')
-        if len(v) != len(set(v)):
+    @model_validator(mode="after")
+    def validate_plan(self):
+        if len(set(self.training_days)) != len(self.training_days):
             raise ValueError('Training days must be unique')
-        return sorted(v)
-
-    @field_validator('end_date')
-    @classmethod
-    def validate_end_date(cls, v, info):
-        start = info.data.get('start_date')
-        if start and v <= start:
+        self.training_days = sorted(self.training_days)
+        if self.end_date <= self.start_date:
             raise ValueError('End date must be after start date')
-        return v
+        return self
 
 
 class PlanCreate(PlanBase):
@@ -140,8 +140,9 @@ class PlanResponse(PlanBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(
+        from_attributes=True,
+    )
 
 
 class PlanWithWorkouts(PlanResponse):
@@ -161,8 +162,9 @@ class PlanSummary(BaseModel):
     completed_workouts: int
     compliance_rate: float
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(
+        from_attributes=True,
+    )
 
 
 # ============== Compliance & Adaptation Schemas ==============
@@ -178,10 +180,18 @@ class ComplianceStats(BaseModel):
     duration_compliance: float
 
 
+class Adaptation(BaseModel):
+    """Schema for a single adaptation applied to a plan"""
+    type: str  # "recovery_week_inserted", "volume_reduced", "intensity_increased", "monitoring"
+    reason: str
+    workout_type: Optional[WorkoutType] = None
+    reduction_percent: Optional[float] = None
+
+
 class AdaptationResult(BaseModel):
     """Schema for adaptation result"""
     plan_id: int
-    adaptations_made: List[dict]
+    adaptations_made: List[Adaptation]
     consecutive_misses: int
     compliance_rate: float
 
@@ -194,6 +204,8 @@ class ActivityMatch(BaseModel):
     workout_type: str
     confidence: str  # "high", "medium", "low"
 
+    model_config = ConfigDict(defer_build=True)
+
 
 # ============== Utility Schemas ==============
 
@@ -209,5 +221,5 @@ class PlanGenerationPreview(BaseModel):
     total_weeks: int
     total_workouts: int
     estimated_total_tss: float
-    workout_type_distribution: dict  # e.g., {"endurance": 10, "threshold": 5, ...}
+    workout_type_distribution: dict[WorkoutType, int]  # e.g., {"endurance": 10, "threshold": 5, ...}
     weekly_breakdown: List[dict]  # List of weekly summaries
@@ -3,10 +3,11 @@
 from datetime import date, datetime
 from typing import Optional, List, Any, Dict
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from app.models.training_plan import TrainingPhilosophy
 from app.models.planned_workout import WorkoutType
+from app.schemas.constraints import PlannedWorkoutMinutes, TargetIFPercent, WeeklyHours
 
 
 # ============== Training Plan Schemas ==============
@@ -18,7 +19,7 @@ class TrainingPlanBase(BaseModel):
     philosophy: TrainingPhilosophy = Field(..., description="Training philosophy")
     start_date: datetime = Field(..., description="Plan start date")
     end_date: datetime = Field(..., description="Plan end date")
-    weekly_hours: float = Field(..., ge=1, le=40, description="Target weekly hours")
+    weekly_hours: WeeklyHours = Field(..., description="Target weekly hours")
     goal_event: Optional[str] = Field(None, max_length=255, description="Goal event name")
     is_active: bool = Field(True, description="Whether the plan is active")
 
@@ -35,7 +36,7 @@ class TrainingPlanUpdate(BaseModel):
     philosophy: Optional[TrainingPhilosophy] = None
     start_date: Optional[datetime] = None
     end_date: Optional[datetime] = None
-    weekly_hours: Optional[float] = Field(None, ge=1, le=40)
+    weekly_hours: Optional[WeeklyHours] = None
     goal_event: Optional[str] = Field(None, max_length=255)
     is_active: Optional[bool] = None
 
@@ -48,9 +49,9 @@ class TrainingPlanResponse(TrainingPlanBase):
     created_at: datetime = Field(..., description="Created timestamp")
     updated_at: datetime = Field(..., description="Updated timestamp")
 
-    class Config:
-        from_attributes = True
-        json_schema_extra = {
+    model_config = ConfigDict(
+        from_attributes=True,
+        json_schema_extra={
             "example": {
                 "id": 1,
                 "user_id": 42,
@@ -64,7 +65,8 @@ class TrainingPlanResponse(TrainingPlanBase):
                 "created_at": "2024-01-01T10:00:00Z",
                 "updated_at": "2024-01-01T10:00:00Z"
             }
-        }
+        },
+    )
 
 
 class TrainingPlanSummary(BaseModel):
@@ -82,8 +84,9 @@ class TrainingPlanSummary(BaseModel):
     completed_workouts: int = Field(..., ge=0, description="Completed workouts")
     compliance_rate: float = Field(..., ge=0, le=1, description="Completion rate")
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(
+        from_attributes=True,
+    )
 
 
 # ============== Planned Workout Schemas ==============
@@ -94,11 +97,11 @@ class PlannedWorkoutBase(BaseModel):
     date: datetime = Field(..., description="Workout date")
     name: str = Field(..., max_length=255, description="Workout name")
     workout_type: WorkoutType = Field(..., description="Type of workout")
-    duration_minutes: int = Field(..., ge=10, le=600, description="Duration in minutes")
+    duration_minutes: PlannedWorkoutMinutes = Field(..., description="Duration in minutes")
     description: Optional[str] = Field(None, description="Workout description")
     intervals_json: Optional[Dict[str, Any]] = Field(None, description="Structured intervals")
     target_tss: Optional[int] = Field(None, ge=0, description="Target TSS")
-    target_if: Optional[int] = Field(None, ge=0, le=150, description="Target IF percentage")
+    target_if: Optional[TargetIFPercent] = Field(None, description="Target IF percentage")
 
 
 class PlannedWorkoutCreate(PlannedWorkoutBase):
@@ -112,11 +115,11 @@ class PlannedWorkoutUpdate(BaseModel):
     date: Optional[datetime] = None
     name: Optional[str] = Field(None, max_length=255)
     workout_type: Optional[WorkoutType] = None
-    duration_minutes: Optional[int] = Field(None, ge=10, le=600)
+    duration_minutes: Optional[PlannedWorkoutMinutes] = None
     description: Optional[str] = None
     intervals_json: Optional[Dict[str, Any]] = None
     target_tss: Optional[int] = Field(None, ge=0)
-    target_if: Optional[int] = Field(None, ge=0, le=150)
+    target_if: Optional[TargetIFPercent] = None
     completed: Optional[bool] = None
 
 
@@ -130,9 +133,9 @@ class PlannedWorkoutResponse(PlannedWorkoutBase):
     created_at: datetime = Field(..., description="Created timestamp")
     updated_at: datetime = Field(..., description="Updated timestamp")
 
-    class Config:
-        from_attributes = True
-        json_schema_extra = {
+    model_config = ConfigDict(
+        from_attributes=True,
+        json_schema_extra={
             "example": {
                 "id": 1,
                 "plan_id": 1,
@@ -155,7 +158,20 @@ class PlannedWorkoutResponse(PlannedWorkoutBase):
                 "created_at": "2024-01-01T10:00:00Z",
                 "updated_at": "2024-01-01T10:00:00Z"
             }
-        }
+        },
+    )
+
+
+class BulkWorkoutRequest(BaseModel):
+    """Schema for applying one action to several workouts in a plan."""
+
+    workout_ids: List[int] = Field(..., min_length=1, max_length=200, description="Workout IDs")
+
+
+class BulkWorkoutResult(BaseModel):
+    """Schema for the outcome of a bulk workout action."""
+
+    updated: int = Field(..., ge=0, description="Number of workouts updated")
 
 
 class TrainingPlanWithWorkouts(TrainingPlanResponse):
@@ -180,8 +196,8 @@ class ComplianceStats(BaseModel):
     actual_tss: float = Field(..., ge=0, description="Actual TSS achieved")
     tss_compliance: float = Field(..., ge=0, description="TSS compliance rate")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "total_workouts": 24,
                 "completed_workouts": 18,
@@ -192,4 +208,5 @@ class ComplianceStats(BaseModel):
                 "actual_tss": 1100,
                 "tss_compliance": 0.917
             }
-        }
+        },
+    )
@@ -4,9 +4,10 @@ from datetime import date, datetime
 from enum import Enum
 from typing import Any, Optional, Union
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from app.models.planned_workout import WorkoutType
+from app.schemas.constraints import PowerFraction
 
 
 class ExportFormat(str, Enum):
@@ -32,22 +33,16 @@ class WorkoutIntervalSchema(BaseModel):
     name: Optional[str] = Field(None, description="Interval name")
     type: Optional[IntervalType] = Field(None, description="Type of interval")
     duration: int = Field(..., ge=1, description="Duration in seconds")
-    power_target: Optional[float] = Field(
+    power_target: Optional[PowerFraction] = Field(
         None,
-        ge=0.0,
-        le=2.0,
         description="Power target as decimal of FTP (0.50 = 50%)"
     )
-    power_low: Optional[float] = Field(
+    power_low: Optional[PowerFraction] = Field(
         None,
-        ge=0.0,
-        le=2.0,
         description="Lower power target as decimal of FTP (for ramps)"
     )
-    power_high: Optional[float] = Field(
+    power_high: Optional[PowerFraction] = Field(
         None,
-        ge=0.0,
-        le=2.0,
         description="Upper power target as decimal of FTP (for ramps)"
     )
     cadence: Optional[int] = Field(
@@ -58,8 +53,8 @@ class WorkoutIntervalSchema(BaseModel):
     )
     repeats: Optional[int] = Field(None, ge=1, description="Number of repetitions")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "name": "Sweet Spot",
                 "duration": 600,
@@ -67,7 +62,8 @@ class WorkoutIntervalSchema(BaseModel):
                 "cadence": 90,
                 "repeats": 3
             }
-        }
+        },
+    )
 
 
 class WorkoutResponse(BaseModel):
@@ -91,9 +87,9 @@ class WorkoutResponse(BaseModel):
     created_at: datetime = Field(..., description="Creation timestamp")
     updated_at: datetime = Field(..., description="Last update timestamp")
 
-    class Config:
-        from_attributes = True
-        json_schema_extra = {
+    model_config = ConfigDict(
+        from_attributes=True,
+        json_schema_extra={
             "example": {
                 "id": 1,
                 "plan_id": 1,
@@ -115,7 +111,25 @@ class WorkoutResponse(BaseModel):
                 "created_at": "2024-01-10T10:00:00Z",
                 "updated_at": "2024-01-10T10:00:00Z"
             }
-        }
+        },
+    )
+
+
+class WorkoutSummaryResponse(BaseModel):
+    """Schema for workout list views that do not need intervals or details."""
+
+    id: int = Field(..., description="Unique workout ID")
+    plan_id: int = Field(..., description="ID of the training plan")
+    date: datetime = Field(..., description="Scheduled date/time")
+    name: str = Field(..., description="Workout name")
+    workout_type: WorkoutType = Field(..., description="Type of workout")
+    duration_minutes: int = Field(..., description="Duration in minutes")
+    target_tss: Optional[int] = Field(None, description="Target Training Stress Score")
+    completed: bool = Field(..., description="Whether workout is completed")
+
+    model_config = ConfigDict(
+        from_attributes=True,
+    )
 
 
 class WorkoutCompleteRequest(BaseModel):
@@ -1,12 +1,25 @@
 from datetime import date, datetime, timedelta
-from typing import Optional, List
+from fractions import Fraction
+from typing import Optional, List, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import and_, case, func, literal, or_, select
 
+from app.models.activity import Activity
 from app.models.planned_workout import PlannedWorkout, WorkoutType
 from app.models.training_plan import TrainingPlan
 
 
+def _truncated_product(column, factor: float):
+    """
+    Build the SQL equivalent of int(column * factor) for a non-negative integer column.
+
+    The factor is applied as an exact fraction with integer floor division, which
+    truncates on every backend; CAST(... AS INTEGER) rounds on PostgreSQL.
+    """
+    ratio = Fraction(factor).limit_denominator(1000)
+    return column * ratio.numerator // ratio.denominator
+
+
 class AdaptationService:
     """Adapt training plans based on completed workouts"""
 
@@ -14,9 +27,13 @@ class AdaptationService:
     TSS_OVERREACH_THRESHOLD = 1.20  # 20% over planned
     TSS_UNDERREACH_THRESHOLD = 0.80  # 20% under planned
     CONSECUTIVE_MISS_THRESHOLD = 3   # Trigger recovery after 3 misses
+    CONSECUTIVE_MISS_LOOKBACK = 10   # Most recent workouts checked for a miss streak
     VOLUME_REDUCTION_FACTOR = 0.90   # 10% reduction
     INTENSITY_INCREASE_FACTOR = 1.05 # 5% increase
 
+    # Activity types that count as cycling, compared after lowercasing and removing spaces
+    CYCLING_ACTIVITY_TYPES = frozenset({"ride", "virtualride", "cycling", "indoorcycling"})
+
     def adapt_plan(self, plan_id: int, db: Session) -> dict:
         """
         Check recent completions and adapt future workouts
@@ -30,12 +47,15 @@ class AdaptationService:
         Returns:
             dict with adaptation summary
         """
-        plan = db.query(TrainingPlan).filter(TrainingPlan.id == plan_id).first()
+        plan = db.get(TrainingPlan, plan_id)
         if not plan:
             raise ValueError(f"Plan {plan_id} not found")
 
+        # Use one reference day for every helper so a run spanning midnight stays consistent
+        today = datetime.combine(date.today(), datetime.min.time())
+
         # Get recent completed and missed workouts
-        recent_workouts = self._get_recent_workouts(plan_id, db, days=14)
+        recent_workouts = self._get_recent_workouts(plan_id, db, today, days=14)
 
         adaptations = {
             "plan_id": plan_id,
@@ -47,30 +67,47 @@ class AdaptationService:
         if not recent_workouts:
             return adaptations
 
-        today = datetime.combine(date.today(), datetime.min.time())
+        # One pass over the recent workouts (newest first, all before today):
+        # count completed and missed workouts, the current run of misses, and
+        # keep only the completed ones that have both an actual and target TSS
+        completed_count = 0
+        missed_count = 0
+        consecutive_misses = 0
+        streak_open = True
+        tss_rated = []
+        for workout, actual_tss in recent_workouts:
+            if workout.completed:
+                completed_count += 1
+                streak_open = False
+                # actual_tss comes from the linked activity, if any
+                if actual_tss and workout.target_tss:
+                    tss_rated.append((workout, actual_tss / workout.target_tss))
+            else:
+                missed_count += 1
+                if streak_open:
+                    consecutive_misses += 1
 
         # Calculate compliance
-        completed = [w for w in recent_workouts if w.completed]
-        # Consider workouts without linked activity as potentially missed
-        not_completed = [w for w in recent_workouts if not w.completed and w.date < today]
+        adaptations["compliance_rate"] = completed_count / len(recent_workouts)
 
-        if recent_workouts:
-            adaptations["compliance_rate"] = len(completed) / len(recent_workouts) if recent_workouts else 0.0
-
-        # Check for consecutive misses
-        consecutive_misses = self._count_consecutive_misses(plan_id, db)
+        # Check for consecutive misses; only look past the recent window when
+        # the streak runs through all of it
+        if streak_open and len(recent_workouts) < self.CONSECUTIVE_MISS_LOOKBACK:
+            consecutive_misses = self._count_consecutive_misses(plan_id, db, today)
+        else:
+            consecutive_misses = min(consecutive_misses, self.CONSECUTIVE_MISS_LOOKBACK)
         adaptations["consecutive_misses"] = consecutive_misses
 
         if consecutive_misses >= self.CONSECUTIVE_MISS_THRESHOLD:
             # Insert recovery week
-            self._insert_recovery_week(plan_id, db)
+            self._insert_recovery_week(plan_id, db, today)
             adaptations["adaptations_made"].append({
                 "type": "recovery_week_inserted",
                 "reason": f"{consecutive_misses} consecutive missed workouts"
             })
-        elif not_completed:
+        elif missed_count:
             # Reduce volume for next week
-            reduction = self._reduce_upcoming_volume(plan_id, db)
+            reduction = self._reduce_upcoming_volume(plan_id, db, today)
             if reduction:
                 adaptations["adaptations_made"].append({
                     "type": "volume_reduced",
@@ -79,28 +116,22 @@ class AdaptationService:
                 })
 
         # Check TSS performance via linked activities
-        for workout in completed:
-            if workout.completed_activity and workout.target_tss:
-                # Get actual TSS from linked activity if available
-                actual_tss = getattr(workout.completed_activity, 'tss', None)
-                if actual_tss and workout.target_tss:
-                    tss_ratio = actual_tss / workout.target_tss
-
-                    if tss_ratio > self.TSS_OVERREACH_THRESHOLD:
-                        # Athlete exceeded expectations - consider increasing
-                        self._increase_future_intensity(plan_id, workout.workout_type, db)
-                        adaptations["adaptations_made"].append({
-                            "type": "intensity_increased",
-                            "workout_type": workout.workout_type.value,
-                            "reason": f"TSS overreach ({tss_ratio:.1%})"
-                        })
-                    elif tss_ratio < self.TSS_UNDERREACH_THRESHOLD:
-                        # Athlete underperformed - check if pattern
-                        adaptations["adaptations_made"].append({
-                            "type": "monitoring",
-                            "workout_type": workout.workout_type.value,
-                            "reason": f"TSS underreach ({tss_ratio:.1%})"
-                        })
+        for workout, tss_ratio in tss_rated:
+            if tss_ratio > self.TSS_OVERREACH_THRESHOLD:
+                # Athlete exceeded expectations - consider increasing
+                self._increase_future_intensity(plan_id, workout.workout_type, db, today)
+                adaptations["adaptations_made"].append({
+                    "type": "intensity_increased",
+                    "workout_type": workout.workout_type.value,
+                    "reason": f"TSS overreach ({tss_ratio:.1%})"
+                })
+            elif tss_ratio < self.TSS_UNDERREACH_THRESHOLD:
+                # Athlete underperformed - check if pattern
+                adaptations["adaptations_made"].append({
+                    "type": "monitoring",
+                    "workout_type": workout.workout_type.value,
+                    "reason": f"TSS underreach ({tss_ratio:.1%})"
+                })
 
         db.commit()
         return adaptations
@@ -112,7 +143,7 @@ class AdaptationService:
         db: Session
     ) -> PlannedWorkout:
         """Link completed Strava activity to planned workout"""
-        workout = db.query(PlannedWorkout).filter(PlannedWorkout.id == workout_id).first()
+        workout = db.get(PlannedWorkout, workout_id)
         if not workout:
             raise ValueError(f"Workout {workout_id} not found")
 
@@ -125,7 +156,7 @@ class AdaptationService:
 
     def mark_workout_completed(self, workout_id: int, db: Session) -> PlannedWorkout:
         """Mark a workout as completed without linking to activity"""
-        workout = db.query(PlannedWorkout).filter(PlannedWorkout.id == workout_id).first()
+        workout = db.get(PlannedWorkout, workout_id)
         if not workout:
             raise ValueError(f"Workout {workout_id} not found")
 
@@ -140,7 +171,7 @@ class AdaptationService:
         Note: The current model doesn't have a 'skipped' status,
         so we keep completed=False and could add a note in description.
         """
-        workout = db.query(PlannedWorkout).filter(PlannedWorkout.id == workout_id).first()
+        workout = db.get(PlannedWorkout, workout_id)
         if not workout:
             raise ValueError(f"Workout {workout_id} not found")
 
@@ -170,13 +201,33 @@ class AdaptationService:
             }
         """
         today = datetime.combine(date.today(), datetime.min.time())
-
-        workouts = db.query(PlannedWorkout).filter(
+        is_completed = PlannedWorkout.completed == True
+        # Consider skipped if description contains [SKIPPED]
+        is_skipped = and_(
+            PlannedWorkout.completed == False,
+            PlannedWorkout.description.contains("[SKIPPED]", autoescape=True),
+        )
+
+        # Aggregate counts and TSS in one query instead of loading every workout
+        # and lazy-loading each linked activity
+        stats = db.query(
+            func.count(PlannedWorkout.id).label("total"),
+            func.coalesce(func.sum(case((is_completed, 1), else_=0)), 0).label("completed"),
+            func.coalesce(func.sum(case((is_skipped, 1), else_=0)), 0).label("skipped"),
+            func.coalesce(
+                func.sum(case((is_completed, func.coalesce(PlannedWorkout.target_tss, 0)), else_=0)), 0
+            ).label("tss_planned"),
+            func.coalesce(
+                func.sum(case((is_completed, func.coalesce(Activity.tss, 0)), else_=0)), 0
+            ).label("tss_actual"),
+        ).outerjoin(
+            Activity, PlannedWorkout.completed_activity_id == Activity.id
+        ).filter(
             PlannedWorkout.plan_id == plan_id,
             PlannedWorkout.date < today
-        ).all()
+        ).one()
 
-        if not workouts:
+        if not stats.total:
             return {
                 "total_workouts": 0,
                 "completed": 0,
@@ -187,32 +238,19 @@ class AdaptationService:
                 "duration_compliance": 0.0
             }
 
-        completed = [w for w in workouts if w.completed]
-        # Consider skipped if description contains [SKIPPED]
-        skipped = [w for w in workouts if not w.completed and w.description and "[SKIPPED]" in w.description]
-        pending = [w for w in workouts if not w.completed and (not w.description or "[SKIPPED]" not in w.description)]
-
         # Calculate TSS compliance for completed workouts with linked activities
-        tss_planned = sum(w.target_tss or 0 for w in completed if w.target_tss)
-        tss_actual = 0.0
-        for w in completed:
-            if w.completed_activity:
-                activity_tss = getattr(w.completed_activity, 'tss', None)
-                if activity_tss:
-                    tss_actual += activity_tss
-        tss_compliance = tss_actual / tss_planned if tss_planned > 0 else 0.0
+        tss_compliance = stats.tss_actual / stats.tss_planned if stats.tss_planned > 0 else 0.0
 
         # Calculate duration compliance (we don't have actual duration in current model)
         # So we use a simple completion-based metric
-        duration_planned = sum(w.duration_minutes or 0 for w in completed)
-        duration_compliance = 1.0 if completed else 0.0  # Simplified - completed = achieved duration
+        duration_compliance = 1.0 if stats.completed else 0.0  # Simplified - completed = achieved duration
 
         return {
-            "total_workouts": len(workouts),
-            "completed": len(completed),
-            "skipped": len(skipped),
-            "pending": len(pending),
-            "compliance_rate": len(completed) / len(workouts) if workouts else 0.0,
+            "total_workouts": stats.total,
+            "completed": stats.completed,
+            "skipped": stats.skipped,
+            "pending": stats.total - stats.completed - stats.skipped,
+            "compliance_rate": stats.completed / stats.total,
             "tss_compliance": round(tss_compliance, 2),
             "duration_compliance": round(duration_compliance, 2)
         }
@@ -253,6 +291,9 @@ class AdaptationService:
         """
         matches = []
 
+        # Normalise activity dates first so candidate workouts for the whole
+        # batch can be fetched with one date-range query
+        dated_activities = []
         for activity in activities:
             activity_date = activity.get("date")
             if not activity_date:
@@ -263,19 +304,36 @@ class AdaptationService:
                 activity_datetime = datetime.combine(activity_date, datetime.min.time())
             else:
                 activity_datetime = activity_date
+            dated_activities.append((activity, activity_datetime))
+
+        if not dated_activities:
+            return matches
+
+        activity_days = [activity_datetime.date() for _, activity_datetime in dated_activities]
+        range_start = datetime.combine(min(activity_days), datetime.min.time())
+        range_end = datetime.combine(max(activity_days) + timedelta(days=1), datetime.min.time())
+
+        workouts = db.query(PlannedWorkout).filter(
+            PlannedWorkout.plan_id == plan_id,
+            PlannedWorkout.date >= range_start,
+            PlannedWorkout.date < range_end,
+            PlannedWorkout.completed == False
+        ).order_by(PlannedWorkout.date, PlannedWorkout.id).all()
+
+        # Keep the earliest incomplete workout on each day
+        workouts_by_day = {}
+        for workout in workouts:
+            workouts_by_day.setdefault(workout.date.date(), workout)
 
+        for activity, activity_datetime in dated_activities:
             # Find planned workout on same day (match by date portion)
-            workout = db.query(PlannedWorkout).filter(
-                PlannedWorkout.plan_id == plan_id,
-                func.date(PlannedWorkout.date) == activity_datetime.date(),
-                PlannedWorkout.completed == False
-            ).first()
+            workout = workouts_by_day.get(activity_datetime.date())
 
             if workout:
                 # Check if activity type matches (basic heuristic)
                 activity_type = activity.get("type", "").lower()
 
-                if self._activity_matches_workout(activity_type, workout.workout_type):
+                if self._activity_matches_workout(activity_type):
                     matches.append({
                         "workout_id": workout.id,
                         "activity_id": activity.get("id"),
@@ -292,111 +350,128 @@ class AdaptationService:
         self,
         plan_id: int,
         db: Session,
+        today: datetime,
         days: int = 14
-    ) -> List[PlannedWorkout]:
-        """Get workouts from the last N days"""
-        start_datetime = datetime.combine(date.today() - timedelta(days=days), datetime.min.time())
-        today = datetime.combine(date.today(), datetime.min.time())
-
-        return db.query(PlannedWorkout).filter(
+    ) -> List[Tuple[PlannedWorkout, Optional[float]]]:
+        """Get workouts from the last N days, each paired with its linked activity's TSS"""
+        start_datetime = today - timedelta(days=days)
+
+        # adapt_plan only needs the activity's TSS, so select that column in the
+        # same query rather than loading each linked Activity
+        return db.query(PlannedWorkout, Activity.tss).outerjoin(
+            Activity, PlannedWorkout.completed_activity_id == Activity.id
+        ).filter(
             PlannedWorkout.plan_id == plan_id,
             PlannedWorkout.date >= start_datetime,
             PlannedWorkout.date < today
         ).order_by(PlannedWorkout.date.desc()).all()
 
-    def _count_consecutive_misses(self, plan_id: int, db: Session) -> int:
+    def _count_consecutive_misses(self, plan_id: int, db: Session, today: datetime) -> int:
         """Count consecutive missed workouts from today backwards"""
-        today = datetime.combine(date.today(), datetime.min.time())
-
-        workouts = db.query(PlannedWorkout).filter(
-            PlannedWorkout.plan_id == plan_id,
-            PlannedWorkout.date < today
-        ).order_by(PlannedWorkout.date.desc()).limit(10).all()
+        # Only the completed flags are read, so skip building ORM objects
+        completed_flags = db.scalars(
+            select(PlannedWorkout.completed).where(
+                PlannedWorkout.plan_id == plan_id,
+                PlannedWorkout.date < today
+            ).order_by(PlannedWorkout.date.desc()).limit(self.CONSECUTIVE_MISS_LOOKBACK)
+        ).all()
 
         consecutive = 0
-        for workout in workouts:
-            if not workout.completed:
+        for completed in completed_flags:
+            if not completed:
                 consecutive += 1
             else:
                 break
 
         return consecutive
 
-    def _insert_recovery_week(self, plan_id: int, db: Session) -> None:
+    def _insert_recovery_week(self, plan_id: int, db: Session, today: datetime) -> None:
         """Convert the next week's workouts to recovery workouts"""
-        start_datetime = datetime.combine(date.today(), datetime.min.time())
-        end_datetime = datetime.combine(date.today() + timedelta(days=7), datetime.min.time())
+        end_datetime = today + timedelta(days=7)
 
-        upcoming = db.query(PlannedWorkout).filter(
+        # Single UPDATE; scaled values are truncated like int()
+        db.query(PlannedWorkout).filter(
             PlannedWorkout.plan_id == plan_id,
-            PlannedWorkout.date >= start_datetime,
+            PlannedWorkout.date >= today,
             PlannedWorkout.date < end_datetime,
             PlannedWorkout.completed == False
-        ).all()
-
-        for workout in upcoming:
-            workout.workout_type = WorkoutType.RECOVERY
-            workout.duration_minutes = int(workout.duration_minutes * 0.6)
-            workout.target_tss = int(workout.target_tss * 0.5) if workout.target_tss else None
-            workout.target_if = 50  # 50% as integer
-            workout.name = f"[Recovery] {workout.name}"
-            workout.description = "Easy recovery spin - take it easy!"
-
-    def _reduce_upcoming_volume(self, plan_id: int, db: Session) -> bool:
+        ).update(
+            {
+                "workout_type": WorkoutType.RECOVERY,
+                "duration_minutes": _truncated_product(PlannedWorkout.duration_minutes, 0.6),
+                "target_tss": case(
+                    (PlannedWorkout.target_tss != 0, _truncated_product(PlannedWorkout.target_tss, 0.5)),
+                    else_=None,
+                ),
+                "target_if": 50,  # 50% as integer
+                "name": literal("[Recovery] ") + PlannedWorkout.name,
+                "description": "Easy recovery spin - take it easy!",
+            },
+            synchronize_session=False,
+        )
+
+    def _reduce_upcoming_volume(self, plan_id: int, db: Session, today: datetime) -> bool:
         """Reduce volume for the next week's workouts"""
-        start_datetime = datetime.combine(date.today(), datetime.min.time())
-        end_datetime = datetime.combine(date.today() + timedelta(days=7), datetime.min.time())
+        end_datetime = today + timedelta(days=7)
 
-        upcoming = db.query(PlannedWorkout).filter(
+        # Scaled values are truncated like int(); NULL target_tss stays NULL
+        updated = db.query(PlannedWorkout).filter(
             PlannedWorkout.plan_id == plan_id,
-            PlannedWorkout.date >= start_datetime,
+            PlannedWorkout.date >= today,
             PlannedWorkout.date < end_datetime,
             PlannedWorkout.completed == False
-        ).all()
-
-        if not upcoming:
-            return False
-
-        for workout in upcoming:
-            workout.duration_minutes = int(workout.duration_minutes * self.VOLUME_REDUCTION_FACTOR)
-            if workout.target_tss:
-                workout.target_tss = int(workout.target_tss * self.VOLUME_REDUCTION_FACTOR)
+        ).update(
+            {
+                "duration_minutes": _truncated_product(
+                    PlannedWorkout.duration_minutes, self.VOLUME_REDUCTION_FACTOR
+                ),
+                "target_tss": _truncated_product(PlannedWorkout.target_tss, self.VOLUME_REDUCTION_FACTOR),
+            },
+            synchronize_session=False,
+        )
 
-        return True
+        return updated > 0
 
     def _increase_future_intensity(
         self,
         plan_id: int,
         workout_type: WorkoutType,
-        db: Session
+        db: Session,
+        today: datetime
     ) -> None:
         """Increase intensity for future workouts of the same type"""
-        today = datetime.combine(date.today(), datetime.min.time())
-
-        future_workouts = db.query(PlannedWorkout).filter(
-            PlannedWorkout.plan_id == plan_id,
-            PlannedWorkout.workout_type == workout_type,
-            PlannedWorkout.date > today,
-            PlannedWorkout.completed == False
-        ).limit(3).all()  # Only adjust next 3 similar workouts
-
-        for workout in future_workouts:
-            if workout.target_if:
-                # target_if is stored as integer percentage
-                new_if = int(min(workout.target_if * self.INTENSITY_INCREASE_FACTOR, 120))
-                workout.target_if = new_if
-            if workout.target_tss:
-                workout.target_tss = int(workout.target_tss * self.INTENSITY_INCREASE_FACTOR)
-
-    def _activity_matches_workout(
-        self,
-        activity_type: str,
-        workout_type: WorkoutType
-    ) -> bool:
-        """Check if a Strava activity type matches a planned workout type"""
-        cycling_types = ["ride", "virtualride", "cycling", "indoor_cycling"]
-
-        if activity_type.lower().replace(" ", "") in [t.replace("_", "") for t in cycling_types]:
-            return True
-
-        return False
+        # Only adjust next 3 similar workouts; fetched separately because
+        # some backends reject LIMIT inside an IN subquery
+        next_workout_ids = db.scalars(
+            select(PlannedWorkout.id).where(
+                PlannedWorkout.plan_id == plan_id,
+                PlannedWorkout.workout_type == workout_type,
+                PlannedWorkout.date > today,
+                PlannedWorkout.completed == False
+            ).order_by(PlannedWorkout.date, PlannedWorkout.id).limit(3)
+        ).all()
+        if not next_workout_ids:
+            return
+
+        # target_if is stored as integer percentage, capped at 120; zero or NULL
+        # targets are left as they are, and rows with neither target are skipped.
+        # Scaled values are truncated like int() at each call.
+        increased_if = _truncated_product(PlannedWorkout.target_if, self.INTENSITY_INCREASE_FACTOR)
+        db.query(PlannedWorkout).filter(
+            PlannedWorkout.id.in_(next_workout_ids),
+            or_(PlannedWorkout.target_if != 0, PlannedWorkout.target_tss != 0)
+        ).update(
+            {
+                "target_if": case(
+                    (PlannedWorkout.target_if == 0, 0),
+                    (increased_if > 120, 120),
+                    else_=increased_if,
+                ),
+                "target_tss": _truncated_product(PlannedWorkout.target_tss, self.INTENSITY_INCREASE_FACTOR),
+            },
+            synchronize_session=False,
+        )
+
+    def _activity_matches_workout(self, activity_type: str) -> bool:
+        """Check if a Strava activity type can fulfil a planned workout (any cycling type)"""
+        return activity_type.lower().replace(" ", "") in self.CYCLING_ACTIVITY_TYPES
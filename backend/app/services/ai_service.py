@@ -189,8 +189,9 @@ class AITrainingService:
         prompt = self._build_forecast_prompt(context, config)
 
         try:
-            # Generate with Gemini
-            response = self.model.generate_content(
+            # Generate with Gemini; the async call keeps the event loop free
+            # for other requests during the model round-trip
+            response = await self.model.generate_content_async(
                 prompt,
                 generation_config=genai.types.GenerationConfig(
                     temperature=0.7,
@@ -210,7 +211,7 @@ class AITrainingService:
 
     def _build_athlete_context(self, user_id: int, db: Session) -> dict:
         """Gather all athlete data for AI context."""
-        user = db.query(User).filter(User.id == user_id).first()
+        user = db.get(User, user_id)
         if not user:
             return {}
 
@@ -263,7 +264,7 @@ class AITrainingService:
             }
 
         # Estimate from user's FTP if no signature exists
-        user = db.query(User).filter(User.id == user_id).first()
+        user = db.get(User, user_id)
         ftp = user.ftp if user and user.ftp else 200
 
         return {
@@ -408,7 +409,7 @@ Return ONLY a valid JSON array with the workouts, no other text. Example format:
             workout_data = json.loads(json_text.strip())
 
             # Get user's FTP for interval calculations
-            user = db.query(User).filter(User.id == user_id).first()
+            user = db.get(User, user_id)
             ftp = user.ftp if user and user.ftp else 200
 
             for w in workout_data:
@@ -564,7 +565,7 @@ Return ONLY a valid JSON array with the workouts, no other text. Example format:
     ) -> list[PlannedWorkout]:
         """Generate rule-based plan when AI is unavailable."""
         workouts = []
-        user = db.query(User).filter(User.id == user_id).first()
+        user = db.get(User, user_id)
         ftp = user.ftp if user and user.ftp else 200
 
         current_date = date.today()
@@ -167,7 +167,9 @@ async def get_current_user(
         logger.warning(f"Authentication failed: {str(e)}")
         raise credentials_exception
 
-    user = db.query(User).filter(User.id == user_id).first()
+    # Primary-key lookup goes through the session identity map, so later
+    # db.get(User, ...) calls within the same request don't hit the database
+    user = db.get(User, user_id)
 
     if user is None:
         logger.warning(f"User {user_id} not found in database")
@@ -1,10 +1,11 @@
 """Export service for generating workout files in various cycling platform formats."""
 
 import re
+import threading
 import xml.etree.ElementTree as ET
-from datetime import date, datetime
+from collections import OrderedDict
+from datetime import date
 from typing import Any, Optional
-from xml.dom import minidom
 
 from app.models.planned_workout import PlannedWorkout
 from app.schemas.workout import IntervalType, WorkoutIntervalSchema
@@ -15,6 +16,59 @@ class ExportService:
 
     AUTHOR = "Cycling Trainer"
     SPORT_TYPE = "bike"
+    RENDER_CACHE_SIZE = 512
+
+    # Filename sanitizing patterns, compiled once for every export request
+    FILENAME_UNSAFE_CHARS = re.compile(r"[^\w\s-]")
+    FILENAME_SEPARATORS = re.compile(r"[-\s]+")
+
+    def __init__(self) -> None:
+        self._render_cache: OrderedDict[tuple, bytes] = OrderedDict()
+        self._render_lock = threading.Lock()
+        self._renderers = {
+            "zwo": self.export_to_zwo,
+            "mrc": self.export_to_mrc,
+            "erg": self.export_to_erg,
+        }
+
+    def render(self, workout: PlannedWorkout, format: str, ftp: int) -> bytes:
+        """
+        Render a workout export as UTF-8 bytes, reusing cached payloads.
+
+        Exports are keyed by workout ID, format, FTP and ``updated_at``, so any
+        edit to the workout invalidates its cached files. This lets the
+        metadata and download endpoints share one render.
+
+        Args:
+            workout: The planned workout to export
+            format: The export format extension (zwo, mrc, erg)
+            ftp: Athlete's FTP in watts
+
+        Returns:
+            Encoded file content
+
+        Raises:
+            ValueError: If the format is not supported
+        """
+        key = (workout.id, format, ftp, workout.updated_at)
+
+        with self._render_lock:
+            content = self._render_cache.get(key)
+            if content is not None:
+                self._render_cache.move_to_end(key)
+                return content
+
+        renderer = self._renderers.get(format)
+        if renderer is None:
+            raise ValueError(f"Unsupported export format: {format}")
+        content = renderer(workout, ftp).encode("utf-8")
+
+        with self._render_lock:
+            self._render_cache[key] = content
+            if len(self._render_cache) > self.RENDER_CACHE_SIZE:
+                self._render_cache.popitem(last=False)
+
+        return content
 
     def export_to_zwo(self, workout: PlannedWorkout, ftp: int) -> str:
         """
@@ -63,13 +117,40 @@ class ExportService:
         for segment in segments:
             self._add_zwo_segment(workout_elem, segment)
 
-        # Convert to pretty-printed XML string
-        xml_str = ET.tostring(root, encoding="unicode")
-        dom = minidom.parseString(xml_str)
-        pretty_xml = dom.toprettyxml(indent="    ", encoding="UTF-8")
-
-        # Remove extra blank lines and return
-        return pretty_xml.decode("utf-8")
+        # Serialize straight to pretty-printed XML; a minidom round-trip
+        # (serialize, re-parse, pretty-print) was most of the render time
+        parts = ['<?xml version="1.0" encoding="UTF-8"?>\n']
+        self._write_zwo_element(root, 0, parts)
+
+        return "".join(parts)
+
+    def _write_zwo_element(self, elem: ET.Element, depth: int, parts: list[str]) -> None:
+        """Append an element as four-space indented XML, one tag per line."""
+        indent = "    " * depth
+        attrs = "".join(
+            f' {name}="{self._escape_xml(value)}"' for name, value in elem.attrib.items()
+        )
+
+        if len(elem):
+            parts.append(f"{indent}<{elem.tag}{attrs}>\n")
+            for child in elem:
+                self._write_zwo_element(child, depth + 1, parts)
+            parts.append(f"{indent}</{elem.tag}>\n")
+        elif elem.text:
+            text = self._escape_xml(elem.text.replace("\r\n", "\n").replace("\r", "\n"))
+            parts.append(f"{indent}<{elem.tag}{attrs}>{text}</{elem.tag}>\n")
+        else:
+            parts.append(f"{indent}<{elem.tag}{attrs}/>\n")
+
+    @staticmethod
+    def _escape_xml(value: str) -> str:
+        """Escape text or attribute data the way minidom writes it."""
+        return (
+            value.replace("&", "&amp;")
+            .replace("<", "&lt;")
+            .replace('"', "&quot;")
+            .replace(">", "&gt;")
+        )
 
     def _add_zwo_segment(self, parent: ET.Element, segment: dict[str, Any]) -> None:
         """Add a single segment to the ZWO workout element."""
@@ -126,7 +207,7 @@ class ExportService:
             elem.set("Power", f"{power_high:.2f}")
 
         # Add cadence if specified
-        if cadence and "elem" in dir():
+        if cadence:
             elem.set("Cadence", str(cadence))
 
     def export_to_erg(self, workout: PlannedWorkout, ftp: int) -> str:
@@ -202,6 +283,12 @@ class ExportService:
             repeat = segment.get("repeat", 1)
             interval_type = segment["type"]
 
+            # Scale the recovery half of work/rest pairs once, not per repeat
+            off_duration = segment.get("off_duration")
+            if off_duration:
+                off_duration_minutes = off_duration / 60.0
+                off_watts = int(segment.get("off_power", 0.50) * ftp)
+
             for _ in range(repeat):
                 if interval_type in (IntervalType.WARMUP, IntervalType.RAMP):
                     # Ramp from low to high
@@ -232,9 +319,7 @@ class ExportService:
                     data_points.append((current_time, watts_high))
 
                 # Handle rest intervals in work/rest pairs
-                if "off_duration" in segment:
-                    off_duration_minutes = segment["off_duration"] / 60.0
-                    off_watts = int(segment.get("off_power", 0.50) * ftp)
+                if off_duration:
                     data_points.append((current_time + 0.01, off_watts))
                     current_time += off_duration_minutes
                     data_points.append((current_time, off_watts))
@@ -318,6 +403,12 @@ class ExportService:
             repeat = segment.get("repeat", 1)
             interval_type = segment["type"]
 
+            # Scale the recovery half of work/rest pairs once, not per repeat
+            off_duration = segment.get("off_duration")
+            if off_duration:
+                off_duration_minutes = off_duration / 60.0
+                off_power = segment.get("off_power", 0.50) * 100
+
             for _ in range(repeat):
                 if interval_type in (IntervalType.WARMUP, IntervalType.RAMP):
                     # Ramp from low to high
@@ -348,9 +439,7 @@ class ExportService:
                     data_points.append((current_time, power_high))
 
                 # Handle rest intervals in work/rest pairs
-                if "off_duration" in segment:
-                    off_duration_minutes = segment["off_duration"] / 60.0
-                    off_power = segment.get("off_power", 0.50) * 100
+                if off_duration:
                     data_points.append((current_time + 0.01, off_power))
                     current_time += off_duration_minutes
                     data_points.append((current_time, off_power))
@@ -512,16 +601,15 @@ class ExportService:
             Safe filename string: workout_name_date.extension
         """
         # Sanitize workout name
-        safe_name = re.sub(r"[^\w\s-]", "", workout.name)
-        safe_name = re.sub(r"[-\s]+", "_", safe_name).strip("_")
+        safe_name = self.FILENAME_UNSAFE_CHARS.sub("", workout.name)
+        safe_name = self.FILENAME_SEPARATORS.sub("_", safe_name).strip("_")
         safe_name = safe_name.lower()[:50]  # Limit length
 
-        # Get date string from workout.date (datetime field in the model)
+        # Get date string from workout.date (datetime field in the model;
+        # datetime is a date subclass, so one check covers both)
         workout_date = workout.date
-        if isinstance(workout_date, datetime):
-            date_str = workout_date.strftime("%Y%m%d")
-        elif isinstance(workout_date, date):
-            date_str = workout_date.strftime("%Y%m%d")
+        if isinstance(workout_date, date):
+            date_str = f"{workout_date:%Y%m%d}"
         else:
             date_str = str(workout_date).replace("-", "")[:8]
 
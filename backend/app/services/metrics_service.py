@@ -10,7 +10,7 @@ This service implements standard cycling training metrics including:
 """
 
 from datetime import date, timedelta
-from typing import Optional
+from typing import Any, Optional
 
 from sqlalchemy import func, and_
 from sqlalchemy.orm import Session
@@ -38,6 +38,17 @@ class MetricsService:
         "zone_6": {"name": "Anaerobic", "min": 121, "max": float("inf")},
     }
 
+    # Flattened (key, name, min %, max % or None) rows, built once at import
+    POWER_ZONE_TABLE = tuple(
+        (
+            zone_key,
+            zone_info["name"],
+            zone_info["min"],
+            None if zone_info["max"] == float("inf") else zone_info["max"],
+        )
+        for zone_key, zone_info in POWER_ZONES.items()
+    )
+
     def calculate_tss(
         self,
         duration_seconds: int,
@@ -358,7 +369,7 @@ class MetricsService:
         user_id: int,
         days: int = 90,
         recalculate: bool = False
-    ) -> list[FitnessMetric]:
+    ) -> tuple[list[FitnessMetric], int]:
         """
         Calculate CTL/ATL/TSB for each day in the specified range.
 
@@ -372,7 +383,7 @@ class MetricsService:
             recalculate: If True, recalculate all metrics. If False, only calculate missing days.
 
         Returns:
-            List of FitnessMetric objects
+            Tuple of (FitnessMetric objects, number of newly created metrics)
         """
         end_date = date.today()
         # We need extra history for EWMA calculation
@@ -404,6 +415,7 @@ class MetricsService:
         # Get or create fitness metrics for each day in the target range
         result_start_date = end_date - timedelta(days=days)
         metrics_list: list[FitnessMetric] = []
+        metrics_created = 0
 
         # Always load existing metrics to avoid UNIQUE constraint violations
         existing = (
@@ -451,6 +463,7 @@ class MetricsService:
                     tsb=tsb
                 )
                 db.add(metric)
+                metrics_created += 1
 
             metrics_list.append(metric)
             current_date += timedelta(days=1)
@@ -458,9 +471,9 @@ class MetricsService:
         db.commit()
 
         # Return only the requested range
-        return [m for m in metrics_list if m.date >= result_start_date]
+        return [m for m in metrics_list if m.date >= result_start_date], metrics_created
 
-    def get_power_zones(self, ftp: int) -> dict[str, tuple[int, int]]:
+    def get_power_zones(self, ftp: int) -> dict[str, dict[str, Any]]:
         """
         Calculate power zones based on FTP.
 
@@ -476,28 +489,22 @@ class MetricsService:
             ftp: Functional Threshold Power in watts
 
         Returns:
-            Dictionary mapping zone name to (min_watts, max_watts) tuple
+            Dictionary mapping zone key to its name, watt range and percent range
         """
         if ftp <= 0:
             raise ValueError("FTP must be greater than zero")
 
-        zones = {}
-        for zone_key, zone_info in self.POWER_ZONES.items():
-            min_watts = int(ftp * zone_info["min"] / 100)
-            if zone_info["max"] == float("inf"):
-                max_watts = None  # No upper limit for zone 6
-            else:
-                max_watts = int(ftp * zone_info["max"] / 100)
-
-            zones[zone_key] = {
-                "name": zone_info["name"],
-                "min_watts": min_watts,
-                "max_watts": max_watts,
-                "min_percent": zone_info["min"],
-                "max_percent": zone_info["max"] if zone_info["max"] != float("inf") else None
+        return {
+            zone_key: {
+                "name": name,
+                "min_watts": ftp * min_pct // 100,
+                # No upper limit for zone 6
+                "max_watts": ftp * max_pct // 100 if max_pct is not None else None,
+                "min_percent": min_pct,
+                "max_percent": max_pct,
             }
-
-        return zones
+            for zone_key, name, min_pct, max_pct in self.POWER_ZONE_TABLE
+        }
 
     def get_zone_for_power(self, power: int, ftp: int) -> str:
         """
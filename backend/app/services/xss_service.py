@@ -337,7 +337,7 @@ class XSSService:
 
         # Get user's FTP
         from app.models.user import User
-        user = db.query(User).filter(User.id == user_id).first()
+        user = db.get(User, user_id)
         ftp = user.ftp if user and user.ftp else 200  # Default FTP if not set
 
         # Get all activities in the date range